@@ -133,6 +133,9 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Rendered report PDFs live outside MEDIA_ROOT; only the download view serves them
+REPORT_PDF_ROOT = BASE_DIR / 'private'
+
 
 # Authentication URLs
 LOGIN_URL = 'login'  # Changed to URL name
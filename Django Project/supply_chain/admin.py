@@ -1,9 +1,35 @@
-from datetime import timezone
 from django.contrib import admin
+from django.db.models.functions import Now
 from django.contrib.auth.admin import UserAdmin
-from .models import User, Project, Package, Bid, ContractorTeam, ActivityLog
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils import timezone
+from django.utils.functional import cached_property
+from .models import User, Project, Package, Bid, ContractorTeam, TeamMember, ActivityLog, log_activity_bulk
 from django.utils.html import format_html
 
+# Paginator for large changelists
+class FastCountPaginator(Paginator):
+    """Paginator that avoids exact COUNT(*) scans on large tables"""
+    
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        connection = connections[qs.db]
+        # Unfiltered lists on PostgreSQL can use the planner's row estimate
+        if connection.vendor == 'postgresql' and not qs.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [qs.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > 0:
+                return row[0]
+        # Count primary keys only, without annotations or ORDER BY
+        return qs.values('pk').order_by().count()
+
 # Custom User Admin
 class CustomUserAdmin(UserAdmin):
     list_display = ('username', 'email', 'company_name', 'user_type', 'is_verified', 'is_staff', 'is_active')
@@ -31,6 +57,11 @@ class CustomUserAdmin(UserAdmin):
     def get_queryset(self, request):
         # Show all users to superusers, limited view for others
         qs = super().get_queryset(request)
+        if request.resolver_match and (request.resolver_match.url_name or '').endswith('_changelist'):
+            qs = qs.only(
+                'id', 'username', 'email', 'company_name', 'user_type',
+                'is_verified', 'is_staff', 'is_active', 'date_joined'
+            )
         if request.user.is_superuser:
             return qs
         return qs.filter(is_superuser=False)
@@ -42,13 +73,23 @@ class PackageInline(admin.TabularInline):
     readonly_fields = ('created_at', 'updated_at')
     fields = ('title', 'package_type', 'estimated_cost', 'deadline', 'status', 'created_at')
     show_change_link = True
+    
+    def get_queryset(self, request):
+        # The formset pins every row to the parent project, so only the
+        # columns rendered by the inline need to be loaded
+        return super().get_queryset(request).only(
+            'id', 'project_id', 'title', 'package_type', 'estimated_cost',
+            'deadline', 'status', 'created_at', 'updated_at'
+        )
 
 class ProjectAdmin(admin.ModelAdmin):
-    list_display = ('title', 'council', 'location', 'budget_range', 'status', 'is_public', 'start_date', 'created_at')
+    list_display = ('title', 'council', 'location', 'budget_range', 'status_display', 'is_public', 'start_date', 'created_at')
     list_filter = ('status', 'is_public', 'start_date', 'council')
     search_fields = ('title', 'description', 'location', 'council__username', 'council__company_name')
     readonly_fields = ('created_at', 'updated_at', 'id')
     date_hierarchy = 'start_date'
+    list_select_related = ('council',)
+    autocomplete_fields = ('council',)
     inlines = [PackageInline]
     
     fieldsets = (
@@ -78,14 +119,20 @@ class BidInline(admin.TabularInline):
     model = Bid
     extra = 0
     readonly_fields = ('submitted_at', 'status')
-    fields = ('contractor', 'amount', 'duration_days', 'status', 'submitted_at')
+    fields = ('contractor', 'bid_amount', 'duration_days', 'status', 'submitted_at')
     show_change_link = True
+    
+    def get_queryset(self, request):
+        # Bid.__str__ renders the contractor name for each row
+        return super().get_queryset(request).select_related('contractor')
 
 class PackageAdmin(admin.ModelAdmin):
-    list_display = ('title', 'project', 'package_type', 'estimated_cost', 'deadline', 'status', 'created_at')
+    list_display = ('title', 'project', 'package_type', 'estimated_cost', 'deadline', 'status_display', 'created_at')
     list_filter = ('package_type', 'status', 'deadline', 'project__council')
     search_fields = ('title', 'description', 'project__title')
     readonly_fields = ('created_at', 'updated_at', 'id')
+    list_select_related = ('project', 'project__council')
+    autocomplete_fields = ('project',)
     inlines = [BidInline]
     
     fieldsets = (
@@ -110,12 +157,34 @@ class PackageAdmin(admin.ModelAdmin):
             return qs.filter(project__council=request.user)
         return qs
 
+# Council filter for bids
+class CouncilFilter(admin.SimpleListFilter):
+    title = 'Council'
+    parameter_name = 'council'
+    
+    def lookups(self, request, model_admin):
+        # Council accounts rarely change, so reuse the option list for a minute
+        return cache.get_or_set(
+            'admin_council_filter_lookups',
+            lambda: list(User.objects.filter(user_type='council').order_by('username').values_list('id', 'username')),
+            60,
+        )
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(package__project__council_id=self.value())
+        return queryset
+
 # Bid Admin
 class BidAdmin(admin.ModelAdmin):
-    list_display = ('package', 'contractor', 'bid_amount', 'status', 'submitted_at', 'reviewed_at')
-    list_filter = ('status', 'submitted_at', 'package__project__council')
+    list_display = ('package', 'contractor', 'bid_amount', 'status_display', 'submitted_at', 'reviewed_at')
+    list_filter = ('status', 'submitted_at', CouncilFilter)
     search_fields = ('proposal_text', 'contractor__username', 'contractor__company_name', 'package__title')
     readonly_fields = ('submitted_at', 'reviewed_at', 'id')
+    list_select_related = ('package', 'package__project', 'package__project__council', 'contractor', 'reviewed_by')
+    autocomplete_fields = ('package', 'contractor', 'reviewed_by')
+    paginator = FastCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Bid Information', {
@@ -132,19 +201,36 @@ class BidAdmin(admin.ModelAdmin):
     
     actions = ['mark_as_under_review', 'mark_as_accepted', 'mark_as_rejected']
     
+    def _log_bulk_review(self, request, bids, action, verb):
+        # One INSERT for the whole selection rather than one per bid
+        log_activity_bulk([
+            ActivityLog(
+                user=request.user,
+                action=action,
+                details=f"{verb} bid from {bid.contractor.get_display_name()} on {bid.package.title}"
+            )
+            for bid in bids
+        ])
+    
     def mark_as_under_review(self, request, queryset):
-        queryset.update(status='under_review', reviewed_by=request.user)
-        self.message_user(request, f"{queryset.count()} bids marked as under review.")
+        bids = list(queryset.select_related('contractor', 'package'))
+        updated = queryset.update(status='under_review', reviewed_by=request.user, reviewed_at=Now(), updated_at=Now())
+        self._log_bulk_review(request, bids, 'bid_reviewed', 'Marked under review')
+        self.message_user(request, f"{updated} bids marked as under review.")
     mark_as_under_review.short_description = "Mark selected bids as Under Review"
     
     def mark_as_accepted(self, request, queryset):
-        queryset.update(status='accepted', reviewed_by=request.user)
-        self.message_user(request, f"{queryset.count()} bids accepted.")
+        bids = list(queryset.select_related('contractor', 'package'))
+        updated = queryset.update(status='accepted', reviewed_by=request.user, reviewed_at=Now(), updated_at=Now())
+        self._log_bulk_review(request, bids, 'bid_awarded', 'Accepted')
+        self.message_user(request, f"{updated} bids accepted.")
     mark_as_accepted.short_description = "Accept selected bids"
     
     def mark_as_rejected(self, request, queryset):
-        queryset.update(status='rejected', reviewed_by=request.user)
-        self.message_user(request, f"{queryset.count()} bids rejected.")
+        bids = list(queryset.select_related('contractor', 'package'))
+        updated = queryset.update(status='rejected', reviewed_by=request.user, reviewed_at=Now(), updated_at=Now())
+        self._log_bulk_review(request, bids, 'bid_reviewed', 'Rejected')
+        self.message_user(request, f"{updated} bids rejected.")
     mark_as_rejected.short_description = "Reject selected bids"
     
     def save_model(self, request, obj, form, change):
@@ -154,10 +240,25 @@ class BidAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
 # Contractor Team Admin
+class TeamMemberInline(admin.TabularInline):
+    model = TeamMember
+    extra = 1
+    readonly_fields = ('assigned_date',)
+    fields = ('contractor', 'role', 'assigned_date')
+    autocomplete_fields = ('contractor',)
+    
+    def get_queryset(self, request):
+        # TeamMember.__str__ renders the contractor name for each row
+        return super().get_queryset(request).select_related('contractor')
+
 class ContractorTeamAdmin(admin.ModelAdmin):
     list_display = ('package', 'lead_contractor', 'assigned_by', 'assigned_date')
     list_filter = ('assigned_date', 'project__council')
     search_fields = ('package__title', 'lead_contractor__company_name', 'notes')
+    readonly_fields = ('assigned_date', 'id')
+    list_select_related = ('package', 'lead_contractor', 'assigned_by', 'project', 'project__council')
+    autocomplete_fields = ('project', 'package', 'lead_contractor', 'assigned_by')
+    inlines = [TeamMemberInline]
     
     fieldsets = (
         ('Team Assignment', {
@@ -176,6 +277,20 @@ class ContractorTeamAdmin(admin.ModelAdmin):
         if not change:  # If creating new team
             obj.assigned_by = request.user
         super().save_model(request, obj, form, change)
+    
+    def save_formset(self, request, form, formset, change):
+        # Insert all new members in one statement instead of one INSERT per row
+        instances = formset.save(commit=False)
+        for obj in formset.deleted_objects:
+            obj.delete()
+        new_members = []
+        for obj in instances:
+            if obj._state.adding:
+                new_members.append(obj)
+            else:
+                obj.save()
+        formset.model.objects.bulk_create(new_members)
+        formset.save_m2m()
 
 # Activity Log Admin
 class ActivityLogAdmin(admin.ModelAdmin):
@@ -184,7 +299,17 @@ class ActivityLogAdmin(admin.ModelAdmin):
     search_fields = ('user__username', 'details', 'ip_address')
     readonly_fields = ('user', 'action', 'details', 'ip_address', 'user_agent', 'timestamp')
     date_hierarchy = 'timestamp'
-    
+    list_select_related = ('user',)
+    paginator = FastCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related('user')
+        # The changelist never renders details/user_agent, so skip the TEXT columns there
+        if request.resolver_match and (request.resolver_match.url_name or '').endswith('_changelist'):
+            qs = qs.only('id', 'action', 'timestamp', 'ip_address', 'user__username', 'user__user_type')
+        return qs
+
     def has_add_permission(self, request):
         return False
     
@@ -4,6 +4,13 @@ from django.utils import timezone
 from .models import User, Project, Package, Bid, ContractorTeam, TeamMember, Report
 
 
+# Filter choices
+_PROJECT_STATUS_CHOICES = (('', 'All Status'), *Project.STATUS_CHOICES)
+_PACKAGE_TYPE_CHOICES = (('', 'All Types'), *Package.PACKAGE_TYPE_CHOICES)
+_PACKAGE_STATUS_CHOICES = (('', 'All Status'), *Package.STATUS_CHOICES)
+_BID_STATUS_CHOICES = (('', 'All Status'), *Bid.STATUS_CHOICES)
+
+
 # User Forms
 class ContractorRegistrationForm(UserCreationForm):
     """Form for contractor registration"""
@@ -220,10 +227,16 @@ class ContractorTeamForm(forms.ModelForm):
         self.fields['name'].help_text = "Team name will be auto-generated if left blank"
 
 
+class ContractorChoiceField(forms.ModelChoiceField):
+    """Choice field labelling contractors by company name"""
+    def label_from_instance(self, obj):
+        return obj.company_name or obj.username
+
+
 class TeamMemberForm(forms.ModelForm):
     """Form for adding team members"""
-    contractor = forms.ModelChoiceField(
-        queryset=User.objects.filter(user_type='contractor'),
+    contractor = ContractorChoiceField(
+        queryset=User.objects.filter(user_type='contractor').only('id', 'username', 'company_name', 'user_type'),
         widget=forms.Select(attrs={'class': 'form-control'})
     )
     
@@ -261,7 +274,7 @@ class ProjectFilterForm(forms.Form):
         'class': 'form-control',
         'placeholder': 'Search projects...'
     }))
-    status = forms.ChoiceField(required=False, choices=[('', 'All Status')] + list(Project.STATUS_CHOICES),
+    status = forms.ChoiceField(required=False, choices=_PROJECT_STATUS_CHOICES,
                                widget=forms.Select(attrs={'class': 'form-control'}))
     location = forms.CharField(required=False, widget=forms.TextInput(attrs={
         'class': 'form-control',
@@ -281,9 +294,9 @@ class PackageFilterForm(forms.Form):
         'class': 'form-control',
         'placeholder': 'Search packages...'
     }))
-    package_type = forms.ChoiceField(required=False, choices=[('', 'All Types')] + list(Package.PACKAGE_TYPE_CHOICES),
+    package_type = forms.ChoiceField(required=False, choices=_PACKAGE_TYPE_CHOICES,
                                     widget=forms.Select(attrs={'class': 'form-control'}))
-    status = forms.ChoiceField(required=False, choices=[('', 'All Status')] + list(Package.STATUS_CHOICES),
+    status = forms.ChoiceField(required=False, choices=_PACKAGE_STATUS_CHOICES,
                               widget=forms.Select(attrs={'class': 'form-control'}))
     sort_by = forms.ChoiceField(required=False, choices=[
         ('deadline', 'Deadline (Soonest)'),
@@ -295,7 +308,7 @@ class PackageFilterForm(forms.Form):
 
 class BidFilterForm(forms.Form):
     """Form for filtering bids"""
-    status = forms.ChoiceField(required=False, choices=[('', 'All Status')] + list(Bid.STATUS_CHOICES),
+    status = forms.ChoiceField(required=False, choices=_BID_STATUS_CHOICES,
                               widget=forms.Select(attrs={'class': 'form-control'}))
     sort_by = forms.ChoiceField(required=False, choices=[
         ('-submitted_at', 'Newest First'),
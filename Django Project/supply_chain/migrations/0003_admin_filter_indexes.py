@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply_chain', '0002_remove_contractorteam_supply_chai_package_b8de05_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['-submitted_at'], name='supply_chai_submitt_06e255_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['reviewed_by', 'status'], name='supply_chai_reviewe_28e147_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['user_type'], name='supply_chai_user_ty_e37396_idx'),
+        ),
+    ]
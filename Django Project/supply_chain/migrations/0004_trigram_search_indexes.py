@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# Trigram GIN indexes backing the admin search_fields (icontains lookups).
+# pg_trgm is PostgreSQL-only, so these are skipped on other backends.
+TRIGRAM_INDEXES = [
+    ('project_title_trgm', 'supply_chain_project', 'title'),
+    ('project_description_trgm', 'supply_chain_project', 'description'),
+    ('package_title_trgm', 'supply_chain_package', 'title'),
+    ('package_description_trgm', 'supply_chain_package', 'description'),
+    ('bid_proposal_text_trgm', 'supply_chain_bid', 'proposal_text'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply_chain', '0003_admin_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
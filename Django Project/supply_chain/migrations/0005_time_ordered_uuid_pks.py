@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:51
+
+import supply_chain.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply_chain', '0004_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bid',
+            name='id',
+            field=models.UUIDField(default=supply_chain.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='contractorteam',
+            name='id',
+            field=models.UUIDField(default=supply_chain.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='package',
+            name='id',
+            field=models.UUIDField(default=supply_chain.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='id',
+            field=models.UUIDField(default=supply_chain.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='id',
+            field=models.UUIDField(default=supply_chain.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply_chain', '0005_time_ordered_uuid_pks'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_superuser', 'user_type'], name='user_active_type_idx'),
+        ),
+    ]
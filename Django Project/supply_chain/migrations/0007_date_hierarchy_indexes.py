@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply_chain', '0006_user_active_type_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['timestamp'], name='supply_chai_timesta_92b76d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['start_date'], name='supply_chai_start_d_029e2d_idx'),
+        ),
+    ]
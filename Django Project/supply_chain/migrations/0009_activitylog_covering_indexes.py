@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+# Covering indexes for the activity feed and the admin action filter, so
+# those queries can be answered from the index alone. INCLUDE columns are
+# PostgreSQL-only, so these are skipped on other backends.
+COVERING_INDEXES = [
+    ('activitylog_user_ts_cover', 'user_id, "timestamp" DESC', 'action'),
+    ('activitylog_action_ts_cover', 'action, "timestamp" DESC', 'user_id'),
+]
+
+
+def create_covering_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, columns, include in COVERING_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON supply_chain_activitylog ({columns}) INCLUDE ({include})'
+        )
+
+
+def drop_covering_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, columns, include in COVERING_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply_chain', '0007_date_hierarchy_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_covering_indexes, drop_covering_indexes),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply_chain', '0009_activitylog_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='bid',
+            name='supply_chai_contrac_74c8f7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='supply_chai_council_73a3df_idx',
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['contractor', 'status', '-submitted_at'], name='supply_chai_contrac_a86aee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['council', 'status', '-created_at'], name='supply_chai_council_d302bf_idx'),
+        ),
+    ]
@@ -1,11 +1,26 @@
-from django.db import models
+from functools import partial
+
+from django.db import models, transaction
+from django.db.models import Sum
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, FileExtensionValidator
 from django.utils import timezone
-from model_utils import FieldTracker
+from django.utils.functional import cached_property
+import os
+import time
 import uuid
 
 
+def uuid7():
+    """Time-ordered UUID (RFC 9562 version 7) so new primary keys append to the index."""
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), 'big') & ((1 << 80) - 1)
+    # Set version (7) and RFC 4122 variant bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 # Council Model
 class Council(models.Model):
     name = models.CharField(max_length=100)
@@ -50,15 +65,16 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
-    # Track field changes
-    tracker = FieldTracker()
-    
     class Meta:
         ordering = ['-date_joined']
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['user_type']),
+            models.Index(fields=['is_superuser', 'user_type'], condition=models.Q(is_active=True), name='user_active_type_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.username} ({self.get_user_type_display()})"
+        return f"{self.username} ({_USER_TYPE_DISPLAY.get(self.user_type, self.user_type)})"
     
     def get_display_name(self):
         """Return display name - company name for contractors, full name for councils"""
@@ -67,6 +83,9 @@ class User(AbstractUser):
         return self.get_full_name() or self.username
 
 
+_USER_TYPE_DISPLAY = dict(User.USER_TYPE_CHOICES)
+
+
 # Project Model
 class Project(models.Model):
     STATUS_CHOICES = (
@@ -76,8 +95,9 @@ class Project(models.Model):
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
     )
+    _STATUS_DISPLAY = dict(STATUS_CHOICES)
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     council = models.ForeignKey(User, on_delete=models.CASCADE, related_name='projects', limit_choices_to={'user_type': 'council'})
     
     # Basic Information
@@ -98,25 +118,47 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
-    # Track field changes
-    tracker = FieldTracker()
-    
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'Projects'
         indexes = [
             models.Index(fields=['status', '-created_at']),
-            models.Index(fields=['council', 'status']),
+            models.Index(fields=['council', 'status', '-created_at']),
+            models.Index(fields=['start_date']),
         ]
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Snapshot the loaded status so post_save signals can detect transitions
+        self._orig_status = self.__dict__.get('status')
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._orig_status = self.status
+    
+    def status_has_changed(self):
+        """Return True if status differs from the value loaded from the database"""
+        return self._orig_status is not None and self.status != self._orig_status
+    
     def __str__(self):
-        return f"{self.title} ({self.get_status_display()})"
+        return f"{self.title} ({self._STATUS_DISPLAY.get(self.status, self.status)})"
+    
+    def status_display(self):
+        """Return the human-readable status"""
+        return self._STATUS_DISPLAY.get(self.status, self.status)
+    status_display.short_description = 'Status'
+    status_display.admin_order_field = 'status'
     
     @property
     def total_bid_value(self):
         """Calculate total bid amount if all packages are awarded"""
-        bids = self.packages.filter(status='awarded').values_list('awarded_bid__bid_amount', flat=True)
-        return sum(bids) if bids else 0
+        # Querysets can annotate this up front to avoid a query per project
+        if hasattr(self, '_total_bid_value'):
+            return self._total_bid_value or 0
+        total = self.packages.filter(status='awarded').aggregate(
+            total=Sum('awarded_bid__bid_amount')
+        )['total']
+        return total or 0
 
 
 # Package Model (Work Package)
@@ -140,8 +182,9 @@ class Package(models.Model):
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
     )
+    _STATUS_DISPLAY = dict(STATUS_CHOICES)
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='packages')
     
     # Basic Information
@@ -165,9 +208,6 @@ class Package(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
-    # Track field changes
-    tracker = FieldTracker()
-    
     class Meta:
         ordering = ['deadline']
         verbose_name_plural = 'Packages'
@@ -177,21 +217,33 @@ class Package(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.title} ({self.get_package_type_display()})"
+        return f"{self.title} ({_PACKAGE_TYPE_DISPLAY.get(self.package_type, self.package_type)})"
+    
+    def status_display(self):
+        """Return the human-readable status"""
+        return self._STATUS_DISPLAY.get(self.status, self.status)
+    status_display.short_description = 'Status'
+    status_display.admin_order_field = 'status'
     
     @property
     def is_deadline_passed(self):
         """Check if bidding deadline has passed"""
+        if hasattr(self, '_deadline_passed'):
+            return self._deadline_passed
         return timezone.now() > self.deadline
     
     @property
     def bids_count(self):
         """Get count of bids for this package"""
+        if hasattr(self, '_bids_count'):
+            return self._bids_count
         return self.bids.count()
     
     @property
     def active_bids_count(self):
         """Get count of active (not rejected) bids"""
+        if hasattr(self, '_active_bids_count'):
+            return self._active_bids_count
         return self.bids.exclude(status='rejected').count()
     
     @property
@@ -204,9 +256,14 @@ class Package(models.Model):
     @property
     def team(self):
         """Get the team assigned to this package"""
+        if hasattr(self, '_active_teams'):
+            return self._active_teams[0] if self._active_teams else None
         return self.teams.filter(status__in=['forming', 'active']).first()
 
 
+_PACKAGE_TYPE_DISPLAY = dict(Package.PACKAGE_TYPE_CHOICES)
+
+
 # Bid Model
 class Bid(models.Model):
     STATUS_CHOICES = (
@@ -217,8 +274,9 @@ class Bid(models.Model):
         ('rejected', 'Rejected'),
         ('withdrawn', 'Withdrawn'),
     )
+    _STATUS_DISPLAY = dict(STATUS_CHOICES)
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     package = models.ForeignKey(Package, on_delete=models.CASCADE, related_name='bids')
     contractor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='bids', limit_choices_to={'user_type': 'contractor'})
     
@@ -243,22 +301,40 @@ class Bid(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
-    # Track field changes
-    tracker = FieldTracker()
-    
     class Meta:
         ordering = ['-submitted_at']
         verbose_name_plural = 'Bids'
         unique_together = ('package', 'contractor')  # One bid per contractor per package
         indexes = [
             models.Index(fields=['status', '-submitted_at']),
-            models.Index(fields=['contractor', 'status']),
+            models.Index(fields=['contractor', 'status', '-submitted_at']),
             models.Index(fields=['package', 'status']),
+            models.Index(fields=['-submitted_at']),
+            models.Index(fields=['reviewed_by', 'status']),
         ]
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Snapshot the loaded status so post_save signals can detect transitions
+        self._orig_status = self.__dict__.get('status')
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._orig_status = self.status
+    
+    def status_has_changed(self):
+        """Return True if status differs from the value loaded from the database"""
+        return self._orig_status is not None and self.status != self._orig_status
+    
     def __str__(self):
         return f"Bid by {self.contractor.get_display_name()} on {self.package.title}"
     
+    def status_display(self):
+        """Return the human-readable status"""
+        return self._STATUS_DISPLAY.get(self.status, self.status)
+    status_display.short_description = 'Status'
+    status_display.admin_order_field = 'status'
+    
     def submit(self):
         """Submit a bid"""
         if self.status == 'draft':
@@ -270,19 +346,20 @@ class Bid(models.Model):
         """Withdraw a submitted bid"""
         if self.status in ['draft', 'submitted', 'under_review']:
             self.status = 'withdrawn'
-            self.save()
+            self.save(update_fields=['status', 'updated_at'])
     
     def accept(self, reviewer):
         """Accept a bid and award the package"""
         self.status = 'accepted'
         self.reviewed_by = reviewer
         self.reviewed_at = timezone.now()
-        self.save()
+        # Include updated_at so auto_now still fires with update_fields
+        self.save(update_fields=['status', 'reviewed_by', 'reviewed_at', 'updated_at'])
         
         # Award the package to this bid
         self.package.awarded_bid = self
         self.package.status = 'awarded'
-        self.package.save()
+        self.package.save(update_fields=['awarded_bid', 'status', 'updated_at'])
     
     def reject(self, reviewer, notes=''):
         """Reject a bid"""
@@ -290,7 +367,7 @@ class Bid(models.Model):
         self.reviewed_by = reviewer
         self.reviewed_at = timezone.now()
         self.review_notes = notes
-        self.save()
+        self.save(update_fields=['status', 'reviewed_by', 'reviewed_at', 'review_notes', 'updated_at'])
 
 
 # Contractor Team Model
@@ -308,7 +385,7 @@ class ContractorTeam(models.Model):
         ('specialist', 'Specialist'),
     )
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Team Information
     name = models.CharField(max_length=255)
@@ -332,9 +409,6 @@ class ContractorTeam(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
-    # Track field changes
-    tracker = FieldTracker()
-    
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'Contractor Teams'
@@ -349,14 +423,16 @@ class ContractorTeam(models.Model):
     def __str__(self):
         return f"{self.name} - {self.project.title}"
     
-    @property
+    @cached_property
     def awarded_contractors(self):
         """Get all contractors with awarded bids in this project"""
-        from django.db.models import Q
+        # Semi-join on contractor ids instead of JOIN + DISTINCT
         return User.objects.filter(
-            bids__package__project=self.project,
-            bids__status='accepted'
-        ).distinct()
+            id__in=Bid.objects.filter(
+                package__project_id=self.project_id,
+                status='accepted'
+            ).values('contractor_id')
+        )
 
 
 # Team Member Model (Through model for many-to-many relationship)
@@ -413,12 +489,30 @@ class ActivityLog(models.Model):
         indexes = [
             models.Index(fields=['user', '-timestamp']),
             models.Index(fields=['action', '-timestamp']),
+            models.Index(fields=['timestamp']),
         ]
     
     def __str__(self):
         return f"{self.user.username} - {self.get_action_display()}"
 
 
+def log_activity(user, action, details='', **fields):
+    """Write an ActivityLog entry once the surrounding transaction commits"""
+    transaction.on_commit(partial(
+        ActivityLog.objects.create, user=user, action=action, details=details, **fields
+    ))
+
+
+def log_activity_bulk(entries, batch_size=500):
+    """Write several unsaved ActivityLog entries with one INSERT per batch"""
+    return ActivityLog.objects.bulk_create(entries, batch_size=batch_size)
+
+
+def awarded_stats_cache_key(contractor_id):
+    """Cache key for a contractor's awarded-projects header stats"""
+    return f'awarded_stats_v1:{contractor_id}'
+
+
 # Report Model (for analytics)
 class Report(models.Model):
     REPORT_TYPE_CHOICES = (
@@ -428,7 +522,7 @@ class Report(models.Model):
         ('completion', 'Completion Report'),
     )
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Report Details
     title = models.CharField(max_length=255)
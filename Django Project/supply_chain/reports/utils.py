@@ -4,17 +4,237 @@ Report data collection utilities for Django Supply Chain Management System.
 This module contains functions to collect and organize data for different types of reports.
 """
 
+import copy
+import hashlib
+import posixpath
+from tempfile import SpooledTemporaryFile
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.http import FileResponse
 from django.utils import timezone
-from django.db.models import Count, Sum, Avg, Min, Max, Q
-from django.http import HttpResponse
+from django.utils.functional import cached_property
+from django.db.models import Count, Sum, Avg, Min, Max, Q, Case, When, Value, CharField
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import (
+    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListFlowable, ListItem
+)
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from io import BytesIO
-from ..models import Bid, Package, ContractorTeam
+from ..models import Bid, Package, ContractorTeam, Report, User
+
+# Private storage for rendered PDFs, one subfolder per report
+PDF_STORAGE_DIR = 'reports/pdf'
+pdf_storage = FileSystemStorage(location=settings.REPORT_PDF_ROOT)
+
+# Rendered PDFs larger than this spill from memory to a temporary file
+PDF_SPOOL_MAX_SIZE = 2 * 1024 * 1024
+
+# Choice labels resolved once instead of via get_FOO_display() per package
+PACKAGE_TYPE_MAP = dict(Package.PACKAGE_TYPE_CHOICES)
+PACKAGE_STATUS_MAP = dict(Package.STATUS_CHOICES)
+REPORT_TYPE_MAP = dict(Report.REPORT_TYPE_CHOICES)
+
+# Package statuses that carry an awarded contract
+AWARDED_STATUSES = ('awarded', 'in_progress', 'completed')
+
+# Columns the collectors read from each package, its awarded bid and contractor
+PACKAGE_REPORT_FIELDS = (
+    'id', 'project', 'title', 'package_type', 'status', 'estimated_cost',
+    'awarded_bid', 'awarded_bid__bid_amount', 'awarded_bid__duration_days',
+)
+
+# Deep-copied, with a fresh generated_date, when a collector is given no project
+_EMPTY_PROGRESS = {
+    'project': None,
+    'error': 'No project provided',
+    'total_packages': 0,
+    'completed_packages': 0,
+    'in_progress_packages': 0,
+    'awarded_packages': 0,
+    'open_packages': 0,
+    'progress_percentage': 0,
+    'total_bids': 0,
+    'accepted_bids': 0,
+    'bid_acceptance_rate': 0,
+    'team_status': 'No project',
+    'team_name': None,
+    'team_members_count': 0,
+    'lead_contractor': None,
+    'packages': [],
+    'recommendations': ['No project data available'],
+    'total_bid_value': 0,
+}
+
+_EMPTY_FINANCIAL = {
+    'project': None,
+    'error': 'No project provided',
+    'total_budget': 0,
+    'total_spent': 0,
+    'remaining_budget': 0,
+    'budget_utilization_percentage': 0,
+    'packages': [],
+    'financial_summary': {
+        'total_packages': 0,
+        'awarded_packages': 0,
+        'total_contract_value': 0,
+        'total_paid': 0,
+        'remaining_balance': 0,
+        'over_budget_packages': 0,
+        'under_budget_packages': 0,
+    }
+}
+
+_EMPTY_QUALITY = {
+    'project': None,
+    'error': 'No project provided',
+    'quality_summary': {
+        'total_packages': 0,
+        'quality_checks_completed': 0,
+        'safety_incidents': 0,
+        'defects_reported': 0,
+        'passed_packages': 0,
+        'failed_packages': 0,
+        'compliance_rate': 0,
+        'average_quality_score': 0,
+    },
+    'packages': [],
+    'recommendations': ['No project data available']
+}
+
+_EMPTY_COMPLETION = {
+    'project': None,
+    'error': 'No project provided',
+    'completion_percentage': 0,
+    'project_duration': 0,
+    'packages': [],
+    'completion_summary': {
+        'completed': 0,
+        'in_progress': 0,
+        'awarded': 0,
+        'open': 0,
+    },
+    'total_project_value': 0,
+    'contractor_summary': [],
+    'team_data': {
+        'name': None,
+        'status': 'No project',
+        'members_count': 0,
+        'members': []
+    },
+    'achievements': ['No project data available'],
+    'lessons_learned': {
+        'success_factors': [],
+        'areas_for_improvement': []
+    },
+    'future_recommendations': [],
+    'final_status': {
+        'project_status': 'NO PROJECT',
+        'completion_date': 'N/A',
+        'prepared_by': 'Automated System'
+    }
+}
+
+
+def _display_name(prefix=''):
+    """SQL equivalent of User.get_display_name() for the user reached via prefix."""
+    full_name = Trim(Concat(
+        f'{prefix}first_name', Value(' '), f'{prefix}last_name', output_field=CharField()
+    ))
+    name = Coalesce(NullIf(full_name, Value('')), f'{prefix}username', output_field=CharField())
+    return Case(
+        When(**{f'{prefix}user_type': 'contractor'},
+             then=Coalesce(NullIf(f'{prefix}company_name', Value('')), name)),
+        default=name,
+        output_field=CharField(),
+    )
+
+
+def _report_packages(project):
+    """Project packages with the awarded bid and its contractor's display name."""
+    return project.packages.select_related('awarded_bid').only(*PACKAGE_REPORT_FIELDS).annotate(
+        contractor_name=_display_name('awarded_bid__contractor__')
+    )
+
+
+class ReportData:
+    """Project data read by the report collectors, each part loaded on first use."""
+
+    def __init__(self, project):
+        self.project = project
+
+    @cached_property
+    def packages(self):
+        return list(_report_packages(self.project).annotate(bid_count=Count('bids')))
+
+    @cached_property
+    def package_stats(self):
+        awarded_filter = Q(status__in=AWARDED_STATUSES)
+        return self.project.packages.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='completed')),
+            in_progress=Count('id', filter=Q(status='in_progress')),
+            awarded=Count('id', filter=Q(status='awarded')),
+            open=Count('id', filter=Q(status='open')),
+            assigned=Count('id', filter=Q(awarded_bid__isnull=False)),
+            total_budget=Sum('awarded_bid__bid_amount', filter=awarded_filter),
+            total_estimated=Sum('estimated_cost'),
+            largest_contract=Max('awarded_bid__bid_amount', filter=awarded_filter),
+            smallest_contract=Min('awarded_bid__bid_amount', filter=awarded_filter),
+            awarded_count=Count('id', filter=awarded_filter),
+        )
+
+    @cached_property
+    def bid_stats(self):
+        return Bid.objects.filter(package__project=self.project).aggregate(
+            total=Count('id'),
+            accepted=Count('id', filter=Q(status='accepted')),
+        )
+
+    @cached_property
+    def team(self):
+        # Reuse the team when the project was loaded with select_related('team')
+        team_relation = self.project._meta.get_field('team')
+        if team_relation.is_cached(self.project):
+            return team_relation.get_cached_value(self.project)
+        return ContractorTeam.objects.defer('notes').select_related(
+            'lead_contractor'
+        ).filter(project=self.project).first()
+
+    @cached_property
+    def team_members(self):
+        return list(self.team.members.select_related('contractor')) if self.team else []
+
+    @cached_property
+    def team_member_count(self):
+        # Reuse the members when they are already loaded
+        if 'team_members' in self.__dict__:
+            return len(self.team_members)
+        return self.team.members.count() if self.team else 0
+
+
+def _contractor_award_totals(project, statuses=None):
+    """
+    Sum awarded bid amounts per contractor for a project in one GROUP BY query.
+    
+    Args:
+        project: Project instance
+        statuses: Optional package statuses to restrict the awarded packages to
+        
+    Returns:
+        list: (display name, total amount) pairs, largest total first
+    """
+    awarded = Q(bids__awarded_package__project=project)
+    if statuses:
+        awarded &= Q(bids__awarded_package__status__in=statuses)
+    totals = User.objects.filter(awarded).values(
+        name=_display_name()
+    ).annotate(total=Sum('bids__bid_amount')).order_by('-total')
+    return [(row['name'], float(row['total'])) for row in totals]
 
 
 def collect_progress_data(project):
@@ -27,58 +247,41 @@ def collect_progress_data(project):
     Returns:
         dict: Dictionary containing all progress report data
     """
+    now = timezone.now()
     if not project:
-        return {
-            'project': None,
-            'generated_date': timezone.now(),
-            'error': 'No project provided',
-            'total_packages': 0,
-            'completed_packages': 0,
-            'in_progress_packages': 0,
-            'awarded_packages': 0,
-            'open_packages': 0,
-            'progress_percentage': 0,
-            'total_bids': 0,
-            'accepted_bids': 0,
-            'bid_acceptance_rate': 0,
-            'team_status': 'No project',
-            'team_name': None,
-            'team_members_count': 0,
-            'lead_contractor': None,
-            'packages': [],
-            'recommendations': ['No project data available'],
-            'total_bid_value': 0,
-        }
+        return {**copy.deepcopy(_EMPTY_PROGRESS), 'generated_date': now}
     
-    packages = project.packages.all()
-    total_packages = packages.count()
-    completed_packages = packages.filter(status='completed').count()
-    in_progress_packages = packages.filter(status='in_progress').count()
-    awarded_packages = packages.filter(status='awarded').count()
+    shared = ReportData(project)
+    package_counts = shared.package_stats
+    total_packages = package_counts['total']
+    completed_packages = package_counts['completed']
+    in_progress_packages = package_counts['in_progress']
+    awarded_packages = package_counts['awarded']
 
     # Calculate progress percentage
     progress_percentage = (completed_packages / total_packages * 100) if total_packages > 0 else 0
 
     # Bid statistics
-    total_bids = Bid.objects.filter(package__project=project).count()
-    accepted_bids = Bid.objects.filter(package__project=project, status='accepted').count()
+    bid_counts = shared.bid_stats
+    total_bids = bid_counts['total']
+    accepted_bids = bid_counts['accepted']
 
     # Team information
-    team = getattr(project, 'team', None)
+    team = shared.team
     team_status = team.status if team else 'Not formed'
 
     # Package-wise data
     package_data = []
-    for package in packages:
-        bid_count = package.bids.count()
+    for package in shared.packages:
+        bid_count = package.bid_count
         accepted_bid = package.awarded_bid
         package_data.append({
             'title': package.title,
-            'package_type': package.get_package_type_display(),
-            'status': package.get_status_display(),
+            'package_type': PACKAGE_TYPE_MAP.get(package.package_type, package.package_type),
+            'status': PACKAGE_STATUS_MAP.get(package.status, package.status),
             'bid_count': bid_count,
             'awarded_amount': accepted_bid.bid_amount if accepted_bid else None,
-            'contractor': accepted_bid.contractor.get_display_name() if accepted_bid else None,
+            'contractor': package.contractor_name,
             'is_completed': package.status == 'completed',
             'is_in_progress': package.status == 'in_progress',
             'is_awarded': package.status == 'awarded',
@@ -86,7 +289,7 @@ def collect_progress_data(project):
         })
 
     # Open packages
-    open_packages = packages.filter(status='open').count()
+    open_packages = package_counts['open']
 
     # Generate recommendations based on progress
     recommendations = []
@@ -104,7 +307,7 @@ def collect_progress_data(project):
 
     return {
         'project': project,
-        'generated_date': timezone.now(),
+        'generated_date': now,
         'total_packages': total_packages,
         'completed_packages': completed_packages,
         'in_progress_packages': in_progress_packages,
@@ -116,7 +319,7 @@ def collect_progress_data(project):
         'bid_acceptance_rate': (accepted_bids/total_bids*100) if total_bids > 0 else 0,
         'team_status': team_status,
         'team_name': team.name if team else None,
-        'team_members_count': team.members.count() if team else 0,
+        'team_members_count': shared.team_member_count,
         'lead_contractor': team.lead_contractor.get_display_name() if team and team.lead_contractor else None,
         'packages': package_data,
         'recommendations': recommendations,
@@ -134,33 +337,17 @@ def collect_financial_data(project):
     Returns:
         dict: Dictionary containing all financial report data
     """
+    now = timezone.now()
     if not project:
-        return {
-            'project': None,
-            'generated_date': timezone.now(),
-            'error': 'No project provided',
-            'total_budget': 0,
-            'total_spent': 0,
-            'remaining_budget': 0,
-            'budget_utilization_percentage': 0,
-            'packages': [],
-            'financial_summary': {
-                'total_packages': 0,
-                'awarded_packages': 0,
-                'total_contract_value': 0,
-                'total_paid': 0,
-                'remaining_balance': 0,
-                'over_budget_packages': 0,
-                'under_budget_packages': 0,
-            }
-        }
+        return {**copy.deepcopy(_EMPTY_FINANCIAL), 'generated_date': now}
     
-    packages = project.packages.all()
-    awarded_packages = packages.filter(status__in=['awarded', 'in_progress', 'completed'])
+    shared = ReportData(project)
+    awarded_list = [package for package in shared.packages if package.status in AWARDED_STATUSES]
 
     # Calculate financial totals
-    total_budget = sum(pkg.awarded_bid.bid_amount for pkg in awarded_packages if pkg.awarded_bid)
-    total_estimated = sum(pkg.estimated_cost for pkg in packages if pkg.estimated_cost)
+    totals = shared.package_stats
+    total_budget = totals['total_budget'] or 0
+    total_estimated = totals['total_estimated'] or 0
 
     # Calculate variances
     budget_variance = total_budget - total_estimated if total_estimated else 0
@@ -168,7 +355,7 @@ def collect_financial_data(project):
 
     # Package-wise financial data
     package_financials = []
-    for package in awarded_packages:
+    for package in awarded_list:
         if package.awarded_bid:
             estimated = package.estimated_cost or 0
             awarded = package.awarded_bid.bid_amount
@@ -177,32 +364,24 @@ def collect_financial_data(project):
             
             package_financials.append({
                 'title': package.title,
-                'package_type': package.get_package_type_display(),
-                'status': package.get_status_display(),
+                'package_type': PACKAGE_TYPE_MAP.get(package.package_type, package.package_type),
+                'status': PACKAGE_STATUS_MAP.get(package.status, package.status),
                 'estimated_cost': estimated,
                 'awarded_amount': awarded,
                 'variance': variance,
                 'variance_percentage': var_pct,
-                'contractor': package.awarded_bid.contractor.get_display_name(),
+                'contractor': package.contractor_name,
             })
 
     # Financial metrics
     budget_utilization = (total_budget/total_estimated*100) if total_estimated else 0
-    avg_package_value = total_budget/awarded_packages.count() if awarded_packages.exists() else 0
-    largest_contract = max((pkg.awarded_bid.bid_amount for pkg in awarded_packages if pkg.awarded_bid), default=0)
-    smallest_contract = min((pkg.awarded_bid.bid_amount for pkg in awarded_packages if pkg.awarded_bid), default=0)
-
-    # Contractor payment analysis
-    contractor_totals = {}
-    for package in awarded_packages:
-        if package.awarded_bid:
-            contractor = package.awarded_bid.contractor.get_display_name()
-            amount = package.awarded_bid.bid_amount
-            contractor_totals[contractor] = contractor_totals.get(contractor, 0) + float(amount)
+    avg_package_value = total_budget/totals['awarded_count'] if totals['awarded_count'] else 0
+    largest_contract = totals['largest_contract'] or 0
+    smallest_contract = totals['smallest_contract'] or 0
 
-    # Sort contractors by total amount
+    # Contractor payment analysis, sorted by total amount
     contractor_analysis = []
-    for contractor, total in sorted(contractor_totals.items(), key=lambda x: x[1], reverse=True):
+    for contractor, total in _contractor_award_totals(project, AWARDED_STATUSES):
         percentage = (total / float(total_budget) * 100) if total_budget else 0
         contractor_analysis.append({
             'name': contractor,
@@ -226,7 +405,7 @@ def collect_financial_data(project):
 
     return {
         'project': project,
-        'generated_date': timezone.now(),
+        'generated_date': now,
         'total_budget': total_budget,
         'total_estimated': total_estimated,
         'budget_variance': budget_variance,
@@ -251,56 +430,48 @@ def collect_quality_data(project):
     Returns:
         dict: Dictionary containing all quality report data
     """
+    now = timezone.now()
     if not project:
-        return {
-            'project': None,
-            'generated_date': timezone.now(),
-            'error': 'No project provided',
-            'quality_summary': {
-                'total_packages': 0,
-                'quality_checks_completed': 0,
-                'safety_incidents': 0,
-                'defects_reported': 0,
-                'passed_packages': 0,
-                'failed_packages': 0,
-                'compliance_rate': 0,
-                'average_quality_score': 0,
-            },
-            'packages': [],
-            'recommendations': ['No project data available']
-        }
+        return {**copy.deepcopy(_EMPTY_QUALITY), 'generated_date': now}
     
-    packages = project.packages.all()
-    completed_packages = packages.filter(status='completed')
-    active_packages = packages.filter(status__in=['awarded', 'in_progress'])
+    shared = ReportData(project)
+    package_counts = shared.package_stats
+    active_packages = package_counts['awarded'] + package_counts['in_progress']
 
     # Package status data
     package_quality_data = []
-    for package in packages:
+    for package in shared.packages:
         package_quality_data.append({
             'title': package.title,
-            'status': package.get_status_display(),
-            'package_type': package.get_package_type_display(),
-            'contractor': package.awarded_bid.contractor.get_display_name() if package.awarded_bid else None,
+            'status': PACKAGE_STATUS_MAP.get(package.status, package.status),
+            'package_type': PACKAGE_TYPE_MAP.get(package.package_type, package.package_type),
+            'contractor': package.contractor_name,
             'is_completed': package.status == 'completed',
             'is_in_progress': package.status == 'in_progress',
             'status_icon': '✅' if package.status == 'completed' else '🔄' if package.status == 'in_progress' else '⏳',
         })
 
-    # Contractor performance analysis
+    # Contractor performance analysis, counted per contractor in one GROUP BY query
+    awarded_contractors = User.objects.filter(
+        bids__awarded_package__project=project
+    ).only('id', 'experience_years').annotate(
+        display_name=_display_name(),
+        awarded_count=Count('bids'),
+        completed_count=Count('bids', filter=Q(bids__awarded_package__status='completed')),
+        first_deadline=Min('bids__awarded_package__deadline'),
+    ).order_by('first_deadline')
+    
     contractors = {}
-    for package in packages.filter(awarded_bid__isnull=False):
-        contractor = package.awarded_bid.contractor
-        name = contractor.get_display_name()
+    for contractor in awarded_contractors:
+        name = contractor.display_name
         if name not in contractors:
             contractors[name] = {
                 'packages': 0,
                 'completed': 0,
                 'experience': contractor.experience_years
             }
-        contractors[name]['packages'] += 1
-        if package.status == 'completed':
-            contractors[name]['completed'] += 1
+        contractors[name]['packages'] += contractor.awarded_count
+        contractors[name]['completed'] += contractor.completed_count
 
     # Contractor analysis with performance metrics
     contractor_performance = []
@@ -316,12 +487,12 @@ def collect_quality_data(project):
 
     # Risk assessment
     risks = []
-    if packages.filter(status='open').exists():
+    if package_counts['open']:
         risks.append("Delayed bidding process may impact project timeline")
 
     if not contractors:
         risks.append("No contractors assigned - project initiation at risk")
-    elif len(contractors) < packages.filter(awarded_bid__isnull=False).count():
+    elif len(contractors) < package_counts['assigned']:
         risks.append("Some packages remain unassigned")
 
     low_experience = [name for name, data in contractors.items() if data['experience'] < 3]
@@ -356,14 +527,14 @@ def collect_quality_data(project):
 
     return {
         'project': project,
-        'generated_date': timezone.now(),
+        'generated_date': now,
         'project_status': project.get_status_display(),
-        'active_packages_count': active_packages.count(),
-        'completed_packages_count': completed_packages.count(),
+        'active_packages_count': active_packages,
+        'completed_packages_count': package_counts['completed'],
         'packages': package_quality_data,
         'contractors': contractor_performance,
         'contractors_count': len(contractors),
-        'active_work_sites': active_packages.count(),
+        'active_work_sites': active_packages,
         'avg_contractor_experience': avg_contractor_experience,
         'risks': risks,
         'recommendations': quality_recommendations,
@@ -381,62 +552,30 @@ def collect_completion_data(project):
     Returns:
         dict: Dictionary containing all completion report data
     """
+    now = timezone.now()
     if not project:
-        return {
-            'project': None,
-            'generated_date': timezone.now(),
-            'error': 'No project provided',
-            'completion_percentage': 0,
-            'project_duration': 0,
-            'final_status': 'No project',
-            'packages': [],
-            'completion_summary': {
-                'completed': 0,
-                'in_progress': 0,
-                'awarded': 0,
-                'open': 0,
-            },
-            'total_project_value': 0,
-            'contractor_summary': [],
-            'team_data': {
-                'name': None,
-                'status': 'No project',
-                'members_count': 0,
-                'members': []
-            },
-            'achievements': ['No project data available'],
-            'lessons_learned': {
-                'success_factors': [],
-                'areas_for_improvement': []
-            },
-            'future_recommendations': [],
-            'final_status': {
-                'project_status': 'NO PROJECT',
-                'completion_date': 'N/A',
-                'prepared_by': 'Automated System'
-            }
-        }
+        return {**copy.deepcopy(_EMPTY_COMPLETION), 'generated_date': now}
     
-    packages = project.packages.all()
-    completed_packages = packages.filter(status='completed')
-    completion_percentage = (completed_packages.count() / packages.count() * 100) if packages.exists() else 0
+    shared = ReportData(project)
+    package_counts = shared.package_stats
+    completion_percentage = (package_counts['completed'] / package_counts['total'] * 100) if package_counts['total'] else 0
 
     # Package completion status
     package_completion_data = []
-    for package in packages:
+    for package in shared.packages:
         status_icon = "✅" if package.status == 'completed' else "🔄" if package.status == 'in_progress' else "⏳"
         awarded_info = {}
         if package.awarded_bid:
             awarded_info = {
-                'awarded_to': package.awarded_bid.contractor.get_display_name(),
+                'awarded_to': package.contractor_name,
                 'contract_value': package.awarded_bid.bid_amount,
                 'duration': package.awarded_bid.duration_days
             }
         
         package_completion_data.append({
             'title': package.title,
-            'type': package.get_package_type_display(),
-            'status': package.get_status_display(),
+            'type': PACKAGE_TYPE_MAP.get(package.package_type, package.package_type),
+            'status': PACKAGE_STATUS_MAP.get(package.status, package.status),
             'status_icon': status_icon,
             'awarded_info': awarded_info,
             'is_completed': package.status == 'completed',
@@ -447,40 +586,37 @@ def collect_completion_data(project):
 
     # Completion summary
     completion_summary = {
-        'completed': completed_packages.count(),
-        'in_progress': packages.filter(status='in_progress').count(),
-        'awarded': packages.filter(status='awarded').count(),
-        'open': packages.filter(status='open').count(),
+        'completed': package_counts['completed'],
+        'in_progress': package_counts['in_progress'],
+        'awarded': package_counts['awarded'],
+        'open': package_counts['open'],
     }
 
     # Financial summary
-    contractor_payments = {}
-    for package in packages.filter(awarded_bid__isnull=False):
-        contractor = package.awarded_bid.contractor.get_display_name()
-        amount = package.awarded_bid.bid_amount
-        contractor_payments[contractor] = contractor_payments.get(contractor, 0) + float(amount)
+    contractor_payments = _contractor_award_totals(project)
 
     contractor_summary = []
-    for contractor, amount in sorted(contractor_payments.items(), key=lambda x: x[1], reverse=True):
+    for contractor, amount in contractor_payments:
         contractor_summary.append({
             'name': contractor,
             'amount': amount,
         })
 
     # Team performance
-    team = getattr(project, 'team', None)
+    team = shared.team
+    team_members = shared.team_members
     team_data = None
     if team:
         team_data = {
             'name': team.name,
             'status': team.get_status_display(),
-            'members_count': team.members.count(),
+            'members_count': len(team_members),
             'members': [
                 {
                     'name': member.contractor.get_display_name(),
                     'role': member.get_role_display()
                 }
-                for member in team.members.all()
+                for member in team_members
             ]
         }
     else:
@@ -503,8 +639,8 @@ def collect_completion_data(project):
     if project.total_bid_value > 0:
         achievements.append(f"✅ Total contract value of ${project.total_bid_value:,.2f} secured")
 
-    if team and team.members.exists():
-        achievements.append(f"✅ Team of {team.members.count()} members successfully coordinated")
+    if team_members:
+        achievements.append(f"✅ Team of {len(team_members)} members successfully coordinated")
 
     if not achievements:
         achievements.append("Project milestones being tracked and monitored")
@@ -554,13 +690,13 @@ def collect_completion_data(project):
     # Final status
     final_status = {
         'project_status': 'COMPLETED' if completion_percentage == 100 else 'IN PROGRESS',
-        'completion_date': timezone.now().strftime('%B %d, %Y') if completion_percentage == 100 else 'Ongoing',
+        'completion_date': now.strftime('%B %d, %Y') if completion_percentage == 100 else 'Ongoing',
         'prepared_by': 'Automated System'
     }
 
     return {
         'project': project,
-        'generated_date': timezone.now(),
+        'generated_date': now,
         'completion_percentage': completion_percentage,
         'project_duration': (project.end_date - project.start_date).days,
         'final_status': project.get_status_display(),
@@ -576,6 +712,180 @@ def collect_completion_data(project):
     }
 
 
+# reportlab styles are built once at import and only read while rendering
+STYLES = getSampleStyleSheet()
+NORMAL_STYLE = STYLES['Normal']
+ITALIC_STYLE = STYLES['Italic']
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=STYLES['Heading1'],
+    fontSize=18,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=colors.darkblue
+)
+
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=STYLES['Heading2'],
+    fontSize=14,
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=colors.darkblue
+)
+
+SUBHEADING_STYLE = ParagraphStyle(
+    'CustomSubheading',
+    parent=STYLES['Heading3'],
+    fontSize=12,
+    spaceAfter=8,
+    spaceBefore=15,
+    textColor=colors.darkgreen
+)
+
+# Custom report text; the extra leading keeps the old gap between lines
+CONTENT_STYLE = ParagraphStyle(
+    'CustomContent',
+    parent=NORMAL_STYLE,
+    leading=18
+)
+
+METADATA_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('BACKGROUND', (0, 0), (0, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+
+def _summary_table_style(label_color):
+    """Two-column label/value table with a shaded label column."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), label_color),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+
+def _header_table_style(header_color):
+    """Data table with a coloured header row."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), header_color),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ])
+
+
+PROGRESS_SUMMARY_STYLE = _summary_table_style(colors.lightblue)
+FINANCIAL_SUMMARY_STYLE = _summary_table_style(colors.lightgreen)
+QUALITY_SUMMARY_STYLE = _summary_table_style(colors.lightyellow)
+COMPLETION_SUMMARY_STYLE = _summary_table_style(colors.lightcyan)
+
+BLUE_HEADER_TABLE_STYLE = _header_table_style(colors.darkblue)
+GREEN_HEADER_TABLE_STYLE = _header_table_style(colors.darkgreen)
+RED_HEADER_TABLE_STYLE = _header_table_style(colors.darkred)
+CYAN_HEADER_TABLE_STYLE = _header_table_style(colors.darkcyan)
+
+# Table column widths; tuples so reportlab cannot alter the shared values
+METADATA_COL_WIDTHS = (2*inch, 4*inch)
+SUMMARY_COL_WIDTHS = (2.5*inch, 2.5*inch)
+PROGRESS_PACKAGE_COL_WIDTHS = (2*inch, 1.5*inch, 1*inch, 2.5*inch)
+FINANCIAL_PACKAGE_COL_WIDTHS = (2*inch, 1.5*inch, 1.5*inch, 1.5*inch)
+FINANCIAL_CONTRACTOR_COL_WIDTHS = (2.5*inch, 1.5*inch, 1*inch)
+QUALITY_CONTRACTOR_COL_WIDTHS = (2*inch, 1*inch, 1*inch, 1.5*inch)
+COMPLETION_PACKAGE_COL_WIDTHS = (2*inch, 1.2*inch, 1.2*inch, 2.1*inch)
+
+
+def _report_pdf_name(report):
+    """
+    Build a PDF storage name that changes whenever the report or its project data changes.
+    
+    Args:
+        report: Report instance
+        
+    Returns:
+        str: Storage name for the rendered PDF
+    """
+    parts = [str(report.pk), report.updated_at.isoformat()]
+    if report.project:
+        versions = Package.objects.filter(project=report.project).aggregate(
+            package_count=Count('id', distinct=True),
+            package_updated=Max('updated_at'),
+            bid_count=Count('bids'),
+            bid_updated=Max('bids__updated_at'),
+        )
+        # Team status, lead and members appear in progress and completion reports
+        versions.update(ContractorTeam.objects.filter(project=report.project).aggregate(
+            team_updated=Max('updated_at'),
+            member_count=Count('members'),
+            member_added=Max('members__assigned_date'),
+        ))
+        # Contractor display names are rendered for awarded bids, team members and the lead
+        versions.update(User.objects.filter(
+            Q(pk=report.created_by_id)
+            | Q(bids__awarded_package__project=report.project)
+            | Q(team_memberships__team__project=report.project)
+            | Q(led_teams__project=report.project)
+        ).aggregate(user_updated=Max('updated_at')))
+        parts.append(report.project.updated_at.isoformat())
+        parts.extend(str(versions[key]) for key in sorted(versions))
+    else:
+        parts.append(report.created_by.updated_at.isoformat())
+    digest = hashlib.md5('|'.join(parts).encode()).hexdigest()
+    return f"{PDF_STORAGE_DIR}/{report.pk}/{digest}.pdf"
+
+
+def _open_report_pdf(report):
+    """Open the stored PDF for the report's current version, rendering it first if needed"""
+    name = _report_pdf_name(report)
+    try:
+        return pdf_storage.open(name, 'rb')
+    except FileNotFoundError:
+        pass
+
+    with SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE) as tmp:
+        _build_pdf(report, tmp)
+        tmp.seek(0)
+        name = pdf_storage.save(name, File(tmp))
+
+    # Open before pruning so a concurrent render pruning this folder cannot pull the file away
+    pdf = pdf_storage.open(name, 'rb')
+
+    # Drop other versions; FileSystemStorage.delete() ignores files already removed
+    folder = posixpath.dirname(name)
+    for filename in pdf_storage.listdir(folder)[1]:
+        if filename != posixpath.basename(name):
+            pdf_storage.delete(posixpath.join(folder, filename))
+    return pdf
+
+
+def delete_report_pdfs(report_id):
+    """Remove every stored PDF version of a report, along with its folder"""
+    folder = f"{PDF_STORAGE_DIR}/{report_id}"
+    try:
+        filenames = pdf_storage.listdir(folder)[1]
+    except FileNotFoundError:
+        return
+    for filename in filenames:
+        pdf_storage.delete(posixpath.join(folder, filename))
+    # FileSystemStorage.delete() removes the directory once it is empty
+    pdf_storage.delete(folder)
+
+
 def generate_pdf_report(report):
     """
     Generate PDF report using reportlab with detailed data.
@@ -584,138 +894,100 @@ def generate_pdf_report(report):
         report: Report instance
 
     Returns:
-        HttpResponse: PDF response
+        FileResponse: PDF streamed from storage
     """
+    # Reuse the stored PDF while neither the report nor its project data has changed
+    return FileResponse(
+        _open_report_pdf(report),
+        as_attachment=True,
+        filename=f'{report.title.replace(" ", "_")}.pdf',
+        content_type='application/pdf',
+    )
+
+
+def _build_pdf(report, target):
+    """Lay out the report with reportlab and write the PDF to a file-like target"""
     # Handle case where report.project might be None
     project_title = report.project.title if report.project else "No Project"
     project_name = report.project if report.project else None
+    now = timezone.now()
     
     # Collect detailed data based on report type
-    if report.report_type == 'progress':
-        data = collect_progress_data(project_name)
-    elif report.report_type == 'financial':
-        data = collect_financial_data(project_name)
-    elif report.report_type == 'quality':
-        data = collect_quality_data(project_name)
-    elif report.report_type == 'completion':
-        data = collect_completion_data(project_name)
+    handlers = REPORT_HANDLERS.get(report.report_type)
+    if handlers:
+        collect, render_content = handlers
+        data = collect(project_name)
     else:
         # Fallback for custom reports
         data = {
             'project': project_name,
-            'generated_date': timezone.now(),
+            'generated_date': now,
         }
 
-    # Create a BytesIO buffer to receive PDF data
-    buffer = BytesIO()
-
     # Create PDF document
-    doc = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
-
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor=colors.darkblue
-    )
-
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        spaceAfter=12,
-        spaceBefore=20,
-        textColor=colors.darkblue
-    )
-
-    subheading_style = ParagraphStyle(
-        'CustomSubheading',
-        parent=styles['Heading3'],
-        fontSize=12,
-        spaceAfter=8,
-        spaceBefore=15,
-        textColor=colors.darkgreen
-    )
-
+    doc = SimpleDocTemplate(target, pagesize=A4)
     # Build PDF content
     story = []
 
     # Title
-    story.append(Paragraph(report.title, title_style))
+    story.append(Paragraph(report.title, TITLE_STYLE))
     story.append(Spacer(1, 12))
 
     # Report metadata
     metadata_data = [
-        ['Report Type:', report.get_report_type_display()],
+        ['Report Type:', REPORT_TYPE_MAP.get(report.report_type, report.report_type)],
         ['Created Date:', report.created_at.strftime('%B %d, %Y')],
         ['Author:', report.created_by.username],
         ['Project:', project_title],
-        ['Generated On:', timezone.now().strftime('%B %d, %Y at %I:%M %p')],
+        ['Generated On:', now.strftime('%B %d, %Y at %I:%M %p')],
     ]
 
-    metadata_table = Table(metadata_data, colWidths=[2*inch, 4*inch])
-    metadata_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('BACKGROUND', (0, 0), (0, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    metadata_table = Table(metadata_data, colWidths=METADATA_COL_WIDTHS)
+    metadata_table.setStyle(METADATA_TABLE_STYLE)
 
     story.append(metadata_table)
     story.append(Spacer(1, 20))
 
     # Generate detailed content based on report type
-    if report.report_type == 'progress':
-        story.extend(_generate_progress_pdf_content(data, styles, subheading_style))
-    elif report.report_type == 'financial':
-        story.extend(_generate_financial_pdf_content(data, styles, subheading_style))
-    elif report.report_type == 'quality':
-        story.extend(_generate_quality_pdf_content(data, styles, subheading_style))
-    elif report.report_type == 'completion':
-        story.extend(_generate_completion_pdf_content(data, styles, subheading_style))
+    if handlers:
+        story.extend(render_content(data))
     else:
         # For custom reports, use the stored content
-        story.append(Paragraph("Report Content", heading_style))
+        story.append(Paragraph("Report Content", HEADING_STYLE))
         story.append(Spacer(1, 12))
-        content_lines = report.content.split('\n')
-        for line in content_lines:
-            if line.strip():
-                story.append(Paragraph(line.strip(), styles['Normal']))
-                story.append(Spacer(1, 6))
+        content_lines = [line.strip() for line in report.content.split('\n') if line.strip()]
+        if content_lines:
+            story.append(Paragraph('<br/>'.join(content_lines), CONTENT_STYLE))
 
     # Add footer
     story.append(Spacer(1, 30))
     footer_text = "Generated by BidFlow Supply Chain Management System"
-    story.append(Paragraph(footer_text, styles['Normal']))
+    story.append(Paragraph(footer_text, NORMAL_STYLE))
 
     # Build PDF
     doc.build(story)
 
-    # Get the PDF value from the buffer
-    pdf = buffer.getvalue()
-    buffer.close()
 
-    # Create HTTP response
-    response = HttpResponse(content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="{report.title.replace(" ", "_")}.pdf"'
-    response.write(pdf)
+def _truncate(text, length):
+    """Shorten text to length characters, marking the cut with an ellipsis"""
+    return text if text is None or len(text) <= length else text[:length] + '...'
 
-    return response
 
+def _bullet_list(items, spacing=4):
+    """Lay out a list of strings as one bulleted flowable"""
+    return ListFlowable(
+        [ListItem(Paragraph(str(item), NORMAL_STYLE), spaceAfter=spacing) for item in items],
+        bulletType='bullet',
+        start='•',
+        leftIndent=12,
+        bulletFontSize=10,
+    )
 
-def _generate_progress_pdf_content(data, styles, subheading_style):
+def _generate_progress_pdf_content(data):
     """Generate PDF content for progress reports"""
     story = []
 
-    story.append(Paragraph("Project Overview", subheading_style))
+    story.append(Paragraph("Project Overview", SUBHEADING_STYLE))
     overview_data = [
         ['Total Packages:', str(data.get('total_packages', 0))],
         ['Completed Packages:', str(data.get('completed_packages', 0))],
@@ -725,63 +997,44 @@ def _generate_progress_pdf_content(data, styles, subheading_style):
         ['Accepted Bids:', str(data.get('accepted_bids', 0))],
     ]
 
-    overview_table = Table(overview_data, colWidths=[2.5*inch, 2.5*inch])
-    overview_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    overview_table = Table(overview_data, colWidths=SUMMARY_COL_WIDTHS)
+    overview_table.setStyle(PROGRESS_SUMMARY_STYLE)
     story.append(overview_table)
     story.append(Spacer(1, 15))
 
     # Package details
     if data.get('packages'):
-        story.append(Paragraph("Package Details", subheading_style))
+        story.append(Paragraph("Package Details", SUBHEADING_STYLE))
         package_headers = ['Package', 'Status', 'Bids', 'Contractor']
         package_data = [package_headers]
 
         for pkg in data['packages'][:10]:  # Limit to first 10 packages
             package_data.append([
-                pkg['title'][:30] + '...' if len(pkg['title']) > 30 else pkg['title'],
+                _truncate(pkg['title'], 30),
                 pkg['status'],
                 str(pkg['bid_count']),
-                pkg['contractor'][:25] + '...' if pkg.get('contractor') and len(pkg['contractor']) > 25 else (pkg.get('contractor') or 'N/A')
+                _truncate(pkg.get('contractor') or 'N/A', 25)
             ])
 
         if len(package_data) > 1:
-            package_table = Table(package_data, colWidths=[2*inch, 1.5*inch, 1*inch, 2.5*inch])
-            package_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ]))
+            package_table = Table(package_data, colWidths=PROGRESS_PACKAGE_COL_WIDTHS)
+            package_table.setStyle(BLUE_HEADER_TABLE_STYLE)
             story.append(package_table)
             story.append(Spacer(1, 15))
 
     # Recommendations
     if data.get('recommendations'):
-        story.append(Paragraph("Recommendations", subheading_style))
-        for rec in data['recommendations']:
-            story.append(Paragraph(f"• {rec}", styles['Normal']))
-            story.append(Spacer(1, 4))
+        story.append(Paragraph("Recommendations", SUBHEADING_STYLE))
+        story.append(_bullet_list(data['recommendations']))
 
     return story
 
 
-def _generate_financial_pdf_content(data, styles, subheading_style):
+def _generate_financial_pdf_content(data):
     """Generate PDF content for financial reports"""
     story = []
 
-    story.append(Paragraph("Financial Summary", subheading_style))
+    story.append(Paragraph("Financial Summary", SUBHEADING_STYLE))
     financial_data = [
         ['Total Budget:', f"${data.get('total_budget', 0):,.2f}"],
         ['Total Estimated:', f"${data.get('total_estimated', 0):,.2f}"],
@@ -790,84 +1043,58 @@ def _generate_financial_pdf_content(data, styles, subheading_style):
         ['Budget Utilization:', f"{data.get('budget_utilization', 0):.1f}%"],
     ]
 
-    financial_table = Table(financial_data, colWidths=[2.5*inch, 2.5*inch])
-    financial_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgreen),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    financial_table = Table(financial_data, colWidths=SUMMARY_COL_WIDTHS)
+    financial_table.setStyle(FINANCIAL_SUMMARY_STYLE)
     story.append(financial_table)
     story.append(Spacer(1, 15))
 
     # Package financials
     if data.get('packages'):
-        story.append(Paragraph("Package Financial Details", subheading_style))
+        story.append(Paragraph("Package Financial Details", SUBHEADING_STYLE))
         package_headers = ['Package', 'Estimated', 'Awarded', 'Variance']
         package_data = [package_headers]
 
         for pkg in data['packages'][:8]:  # Limit to first 8 packages
             package_data.append([
-                pkg['title'][:25] + '...' if len(pkg['title']) > 25 else pkg['title'],
+                _truncate(pkg['title'], 25),
                 f"${pkg['estimated_cost']:,.0f}" if pkg['estimated_cost'] else 'N/A',
                 f"${pkg['awarded_amount']:,.0f}",
                 f"${pkg['variance']:,.0f}"
             ])
 
         if len(package_data) > 1:
-            package_table = Table(package_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-            package_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ]))
+            package_table = Table(package_data, colWidths=FINANCIAL_PACKAGE_COL_WIDTHS)
+            package_table.setStyle(GREEN_HEADER_TABLE_STYLE)
             story.append(package_table)
             story.append(Spacer(1, 15))
 
     # Contractor analysis
     if data.get('contractor_analysis'):
-        story.append(Paragraph("Contractor Analysis", subheading_style))
+        story.append(Paragraph("Contractor Analysis", SUBHEADING_STYLE))
         contractor_headers = ['Contractor', 'Total Amount', 'Percentage']
         contractor_data = [contractor_headers]
 
         for contractor in data['contractor_analysis'][:6]:  # Limit to first 6
             contractor_data.append([
-                contractor['name'][:25] + '...' if len(contractor['name']) > 25 else contractor['name'],
+                _truncate(contractor['name'], 25),
                 f"${contractor['total_amount']:,.0f}",
                 f"{contractor['percentage']:.1f}%"
             ])
 
         if len(contractor_data) > 1:
-            contractor_table = Table(contractor_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
-            contractor_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ]))
+            contractor_table = Table(contractor_data, colWidths=FINANCIAL_CONTRACTOR_COL_WIDTHS)
+            contractor_table.setStyle(BLUE_HEADER_TABLE_STYLE)
             story.append(contractor_table)
             story.append(Spacer(1, 15))
 
     return story
 
 
-def _generate_quality_pdf_content(data, styles, subheading_style):
+def _generate_quality_pdf_content(data):
     """Generate PDF content for quality reports"""
     story = []
 
-    story.append(Paragraph("Project Status Overview", subheading_style))
+    story.append(Paragraph("Project Status Overview", SUBHEADING_STYLE))
     status_data = [
         ['Active Packages:', str(data.get('active_packages_count', 0))],
         ['Completed Packages:', str(data.get('completed_packages_count', 0))],
@@ -876,70 +1103,49 @@ def _generate_quality_pdf_content(data, styles, subheading_style):
         ['Avg Contractor Experience:', f"{data.get('avg_contractor_experience', 0):.1f} years"],
     ]
 
-    status_table = Table(status_data, colWidths=[2.5*inch, 2.5*inch])
-    status_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightyellow),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    status_table = Table(status_data, colWidths=SUMMARY_COL_WIDTHS)
+    status_table.setStyle(QUALITY_SUMMARY_STYLE)
     story.append(status_table)
     story.append(Spacer(1, 15))
 
     # Contractor performance
     if data.get('contractors'):
-        story.append(Paragraph("Contractor Performance", subheading_style))
+        story.append(Paragraph("Contractor Performance", SUBHEADING_STYLE))
         contractor_headers = ['Contractor', 'Packages', 'Completed', 'Success Rate']
         contractor_data = [contractor_headers]
 
         for contractor in data['contractors'][:6]:  # Limit to first 6
             contractor_data.append([
-                contractor['name'][:25] + '...' if len(contractor['name']) > 25 else contractor['name'],
+                _truncate(contractor['name'], 25),
                 str(contractor['packages_assigned']),
                 str(contractor['packages_completed']),
                 f"{contractor['completion_rate']:.1f}%"
             ])
 
         if len(contractor_data) > 1:
-            contractor_table = Table(contractor_data, colWidths=[2*inch, 1*inch, 1*inch, 1.5*inch])
-            contractor_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkred),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ]))
+            contractor_table = Table(contractor_data, colWidths=QUALITY_CONTRACTOR_COL_WIDTHS)
+            contractor_table.setStyle(RED_HEADER_TABLE_STYLE)
             story.append(contractor_table)
             story.append(Spacer(1, 15))
 
     # Risks and Recommendations
     if data.get('risks'):
-        story.append(Paragraph("Identified Risks", subheading_style))
-        for risk in data['risks']:
-            story.append(Paragraph(f"• {risk}", styles['Normal']))
-            story.append(Spacer(1, 4))
+        story.append(Paragraph("Identified Risks", SUBHEADING_STYLE))
+        story.append(_bullet_list(data['risks']))
         story.append(Spacer(1, 10))
 
     if data.get('recommendations'):
-        story.append(Paragraph("Quality Recommendations", subheading_style))
-        for rec in data['recommendations']:
-            story.append(Paragraph(f"• {rec}", styles['Normal']))
-            story.append(Spacer(1, 4))
+        story.append(Paragraph("Quality Recommendations", SUBHEADING_STYLE))
+        story.append(_bullet_list(data['recommendations']))
 
     return story
 
 
-def _generate_completion_pdf_content(data, styles, subheading_style):
+def _generate_completion_pdf_content(data):
     """Generate PDF content for completion reports"""
     story = []
 
-    story.append(Paragraph("Completion Summary", subheading_style))
+    story.append(Paragraph("Completion Summary", SUBHEADING_STYLE))
     completion_data = [
         ['Completion Percentage:', f"{data.get('completion_percentage', 0):.1f}%"],
         ['Project Duration:', f"{data.get('project_duration', 0)} days"],
@@ -947,70 +1153,56 @@ def _generate_completion_pdf_content(data, styles, subheading_style):
         ['Final Status:', data.get('final_status', 'Unknown')],
     ]
 
-    completion_table = Table(completion_data, colWidths=[2.5*inch, 2.5*inch])
-    completion_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightcyan),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    completion_table = Table(completion_data, colWidths=SUMMARY_COL_WIDTHS)
+    completion_table.setStyle(COMPLETION_SUMMARY_STYLE)
     story.append(completion_table)
     story.append(Spacer(1, 15))
 
     # Package completion status
     if data.get('packages'):
-        story.append(Paragraph("Package Completion Status", subheading_style))
+        story.append(Paragraph("Package Completion Status", SUBHEADING_STYLE))
         package_headers = ['Package', 'Type', 'Status', 'Contractor']
         package_data = [package_headers]
 
         for pkg in data['packages'][:8]:  # Limit to first 8 packages
             package_data.append([
-                pkg['title'][:25] + '...' if len(pkg['title']) > 25 else pkg['title'],
-                pkg['type'][:15] + '...' if len(pkg['type']) > 15 else pkg['type'],
+                _truncate(pkg['title'], 25),
+                _truncate(pkg['type'], 15),
                 pkg['status'],
-                pkg.get('awarded_info', {}).get('awarded_to', 'N/A')[:20] + '...' if pkg.get('awarded_info', {}).get('awarded_to') and len(pkg['awarded_info']['awarded_to']) > 20 else pkg.get('awarded_info', {}).get('awarded_to', 'N/A')
+                _truncate(pkg.get('awarded_info', {}).get('awarded_to', 'N/A'), 20)
             ])
 
         if len(package_data) > 1:
-            package_table = Table(package_data, colWidths=[2*inch, 1.2*inch, 1.2*inch, 2.1*inch])
-            package_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkcyan),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ]))
+            package_table = Table(package_data, colWidths=COMPLETION_PACKAGE_COL_WIDTHS)
+            package_table.setStyle(CYAN_HEADER_TABLE_STYLE)
             story.append(package_table)
             story.append(Spacer(1, 15))
 
     # Achievements
     if data.get('achievements'):
-        story.append(Paragraph("Project Achievements", subheading_style))
-        for achievement in data['achievements']:
-            story.append(Paragraph(f"• {achievement}", styles['Normal']))
-            story.append(Spacer(1, 4))
+        story.append(Paragraph("Project Achievements", SUBHEADING_STYLE))
+        story.append(_bullet_list(data['achievements']))
         story.append(Spacer(1, 10))
 
     # Lessons Learned
     if data.get('lessons_learned'):
-        story.append(Paragraph("Lessons Learned", subheading_style))
+        story.append(Paragraph("Lessons Learned", SUBHEADING_STYLE))
         if data['lessons_learned'].get('success_factors'):
-            story.append(Paragraph("Success Factors:", styles['Italic']))
-            for factor in data['lessons_learned']['success_factors']:
-                story.append(Paragraph(f"• {factor}", styles['Normal']))
-                story.append(Spacer(1, 2))
+            story.append(Paragraph("Success Factors:", ITALIC_STYLE))
+            story.append(_bullet_list(data['lessons_learned']['success_factors'], spacing=2))
             story.append(Spacer(1, 8))
 
         if data['lessons_learned'].get('areas_for_improvement'):
-            story.append(Paragraph("Areas for Improvement:", styles['Italic']))
-            for area in data['lessons_learned']['areas_for_improvement']:
-                story.append(Paragraph(f"• {area}", styles['Normal']))
-                story.append(Spacer(1, 2))
+            story.append(Paragraph("Areas for Improvement:", ITALIC_STYLE))
+            story.append(_bullet_list(data['lessons_learned']['areas_for_improvement'], spacing=2))
 
     return story
+
+
+# Data collector and PDF content builder for each generated report type
+REPORT_HANDLERS = {
+    'progress': (collect_progress_data, _generate_progress_pdf_content),
+    'financial': (collect_financial_data, _generate_financial_pdf_content),
+    'quality': (collect_quality_data, _generate_quality_pdf_content),
+    'completion': (collect_completion_data, _generate_completion_pdf_content),
+}
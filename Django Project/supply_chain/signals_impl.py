@@ -1,59 +1,78 @@
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
-from .models import Bid, Package, User, Project, ActivityLog, ContractorTeam, TeamMember
-from model_utils import FieldTracker
+from .models import (
+    Bid, Package, User, Project, ActivityLog, ContractorTeam, TeamMember, Report,
+    log_activity, log_activity_bulk, awarded_stats_cache_key,
+)
+from .reports.utils import delete_report_pdfs
 
 
 @receiver(post_save, sender=Bid)
 def track_bid_changes(sender, instance, created, **kwargs):
     """Track changes to bid records and auto-create teams"""
+    if kwargs.get('raw'):
+        # Fixture loads save rows as-is; no logs or side effects
+        return
     if created:
-        ActivityLog.objects.create(
+        log_activity(
             user=instance.contractor,
             action='bid_submitted',
             details=f"Submitted bid on {instance.package.title}: ${instance.bid_amount}"
         )
     else:
         # Check if status changed to accepted
-        if instance.tracker.has_changed('status') and instance.status == 'accepted':
-            ActivityLog.objects.create(
-                user=instance.package.project.council,
+        if instance.status_has_changed() and instance.status == 'accepted':
+            project = instance.package.project
+            # Log entries are collected and written together once the transaction commits
+            logs = [ActivityLog(
+                user=project.council,
                 action='bid_awarded',
                 details=f"Awarded package {instance.package.title} to {instance.contractor.get_display_name()}"
-            )
-            
-            # Auto-create project team if it doesn't exist
-            project = instance.package.project
-            team, created = ContractorTeam.objects.get_or_create(
-                project=project,
-                defaults={
-                    'name': f"{project.title} Team",
-                    'assigned_by': project.council,
-                    'status': 'forming'
-                }
-            )
+            )]
             
-            # Auto-add contractor to team if not already a member
-            if not team.members.filter(contractor=instance.contractor).exists():
-                TeamMember.objects.create(
-                    team=team,
-                    contractor=instance.contractor,
-                    role='member'
+            with transaction.atomic():
+                # Auto-create project team if it doesn't exist
+                team, created = ContractorTeam.objects.get_or_create(
+                    project=project,
+                    defaults={
+                        'name': f"{project.title} Team",
+                        'assigned_by': project.council,
+                        'lead_contractor': instance.contractor,
+                        'status': 'forming'
+                    }
                 )
-                ActivityLog.objects.create(
-                    user=project.council,
-                    action='team_member_added',
-                    details=f"Added {instance.contractor.get_display_name()} to {project.title} team"
-                )
-            
-            # Set lead contractor if this is the first awarded bid
-            if not team.lead_contractor:
-                team.lead_contractor = instance.contractor
-                team.save()
                 
-        elif instance.tracker.has_changed('status') and instance.status == 'rejected':
-            ActivityLog.objects.create(
+                # Auto-add contractor to team if not already a member; a new team has none
+                if created:
+                    TeamMember.objects.create(team=team, contractor=instance.contractor, role='member')
+                    member_created = True
+                else:
+                    member, member_created = TeamMember.objects.get_or_create(
+                        team=team,
+                        contractor=instance.contractor,
+                        defaults={'role': 'member'}
+                    )
+                if member_created:
+                    logs.append(ActivityLog(
+                        user=project.council,
+                        action='team_member_added',
+                        details=f"Added {instance.contractor.get_display_name()} to {project.title} team"
+                    ))
+                
+                # Set lead contractor if this is the first awarded bid
+                if not team.lead_contractor_id:
+                    ContractorTeam.objects.filter(pk=team.pk).update(lead_contractor=instance.contractor, updated_at=timezone.now())
+                    team.lead_contractor = instance.contractor
+                
+            transaction.on_commit(partial(log_activity_bulk, logs))
+                
+        elif instance.status_has_changed() and instance.status == 'rejected':
+            log_activity(
                 user=instance.package.project.council,
                 action='bid_reviewed',
                 details=f"Rejected bid from {instance.contractor.get_display_name()} on {instance.package.title}"
@@ -63,16 +82,19 @@ def track_bid_changes(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Project)
 def track_project_changes(sender, instance, created, **kwargs):
     """Track changes to project records"""
+    if kwargs.get('raw'):
+        # Fixture loads write no logs
+        return
     if created:
-        ActivityLog.objects.create(
+        log_activity(
             user=instance.council,
             action='project_created',
             details=f"Created project: {instance.title}"
         )
     else:
         # Check if project was published
-        if instance.tracker.has_changed('status') and instance.status == 'published':
-            ActivityLog.objects.create(
+        if instance.status_has_changed() and instance.status == 'published':
+            log_activity(
                 user=instance.council,
                 action='project_published',
                 details=f"Published project: {instance.title}"
@@ -82,20 +104,66 @@ def track_project_changes(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Package)
 def track_package_changes(sender, instance, created, **kwargs):
     """Track package creation"""
+    if kwargs.get('raw'):
+        # Fixture loads write no logs
+        return
     if created:
-        ActivityLog.objects.create(
+        log_activity(
             user=instance.project.council,
             action='project_updated',
             details=f"Created work package: {instance.title} in {instance.project.title}"
         )
 
 
+def _drop_awarded_stats(contractor_id):
+    """Forget a contractor's cached awarded-projects stats once the transaction commits"""
+    if contractor_id:
+        transaction.on_commit(partial(cache.delete, awarded_stats_cache_key(contractor_id)))
+
+
+@receiver(post_save, sender=Bid)
+def invalidate_awarded_stats_for_bid(sender, instance, **kwargs):
+    """Bid amount, duration or status changes move the contractor's awarded stats"""
+    _drop_awarded_stats(instance.contractor_id)
+
+
+@receiver(post_delete, sender=Bid)
+def invalidate_awarded_stats_for_deleted_bid(sender, instance, **kwargs):
+    """Deleting an awarded bid clears the package's award without saving the package"""
+    _drop_awarded_stats(instance.contractor_id)
+
+
+@receiver(post_save, sender=Package)
+def invalidate_awarded_stats_for_package(sender, instance, **kwargs):
+    """Status changes on an awarded package move its contractor's awarded stats"""
+    if not instance.awarded_bid_id:
+        return
+    # Bid.accept() hands over the bid it just saved, so usually no query is needed
+    awarded_bid = Package._meta.get_field('awarded_bid')
+    if awarded_bid.is_cached(instance):
+        contractor_id = awarded_bid.get_cached_value(instance).contractor_id
+    else:
+        contractor_id = Bid.objects.filter(pk=instance.awarded_bid_id).values_list(
+            'contractor_id', flat=True
+        ).first()
+    _drop_awarded_stats(contractor_id)
+
+
 @receiver(post_save, sender=User)
 def track_user_creation(sender, instance, created, **kwargs):
     """Track new user registrations"""
+    if kwargs.get('raw'):
+        # Fixture loads write no logs
+        return
     if created and instance.user_type == 'contractor':
-        ActivityLog.objects.create(
+        log_activity(
             user=instance,
             action='profile_updated',
             details=f"New contractor registration: {instance.company_name or instance.username}"
         )
+
+
+@receiver(post_delete, sender=Report)
+def delete_stored_report_pdfs(sender, instance, **kwargs):
+    """Rendered PDFs are only pruned on download, so remove them with their report"""
+    transaction.on_commit(partial(delete_report_pdfs, instance.pk))
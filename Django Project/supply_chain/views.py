@@ -3,28 +3,32 @@ from django.views.generic import ListView, DetailView, CreateView, UpdateView, D
 from django.contrib.auth.views import LoginView, LogoutView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
-from django.db.models import Q, Count, Sum, Avg, Min, Max
-from django.urls import reverse_lazy
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, Sum, Avg, Prefetch, Exists, OuterRef
+from django.urls import reverse, reverse_lazy
 from django.utils import timezone
-from django.http import JsonResponse, HttpResponseForbidden
+from django.http import JsonResponse
 from datetime import timedelta
+from decimal import Decimal
 import csv
-from django.http import HttpResponse
+import hashlib
+from functools import partial
+from django.http import HttpResponse, StreamingHttpResponse
 
 from .models import (
     User, Project, Package, Bid, ContractorTeam, TeamMember, 
-    ActivityLog, Report
+    Report, awarded_stats_cache_key, log_activity
 )
 from .forms import (
     ContractorRegistrationForm, ContractorProfileForm, ProjectForm,
     PackageForm, BidForm, BidReviewForm, ContractorTeamForm, TeamMemberForm,
     ReportForm, ProjectFilterForm
 )
-from .reports.utils import (
-    collect_progress_data, collect_financial_data, 
-    collect_quality_data, collect_completion_data,
-    generate_pdf_report
-)
+from .reports.utils import generate_pdf_report
 
 
 # Mixins
@@ -48,33 +52,59 @@ class CouncilRequiredMixin(UserPassesTestMixin):
         return redirect('home')
 
 
-class OwnerOrCouncilMixin(UserPassesTestMixin):
+class CachedObjectMixin:
+    """Fetch the view's object once per request, e.g. for test_func and get()"""
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object(queryset)
+        return self._cached_object
+
+
+class OwnerOrCouncilMixin(CachedObjectMixin, UserPassesTestMixin):
     """Mixin to restrict to project owner or superuser"""
     def test_func(self):
         obj = self.get_object()
         return obj.council == self.request.user or self.request.user.is_superuser
 
 
+# Paginator for filtered list views
+class CachedCountPaginator(Paginator):
+    """Paginator that reuses the result count across page navigation, for public lists only"""
+    count_timeout = 60
+    
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        # The SQL carries the filters and the requesting user, so it identifies the list
+        key = 'paginator_count_' + hashlib.md5(str(qs.query).encode()).hexdigest()
+        return cache.get_or_set(key, lambda: qs.values('pk').order_by().count(), self.count_timeout)
+
+
 # Authentication Views
+def get_client_ip(request):
+    """Client address, preferring the first X-Forwarded-For hop"""
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    return x_forwarded_for.split(',')[0] if x_forwarded_for else request.META.get('REMOTE_ADDR')
+
+
 class ContractorLoginView(LoginView):
     """Login view for contractors"""
     template_name = 'auth/login.html'
     redirect_authenticated_user = True
     
-    def get_success_url(self):
-        # Log activity
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='login',
-            ip_address=self.get_client_ip(self.request),
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        # Log activity once per successful login
+        log_activity(
+            self.request.user,
+            'login',
+            ip_address=get_client_ip(self.request),
             user_agent=self.request.META.get('HTTP_USER_AGENT', '')
         )
-        return reverse_lazy('contractor_dashboard') if self.request.user.user_type == 'contractor' else reverse_lazy('council_dashboard')
+        return response
     
-    @staticmethod
-    def get_client_ip(request):
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        return x_forwarded_for.split(',')[0] if x_forwarded_for else request.META.get('REMOTE_ADDR')
+    def get_success_url(self):
+        return reverse_lazy('contractor_dashboard') if self.request.user.user_type == 'contractor' else reverse_lazy('council_dashboard')
 
 
 class ContractorLogoutView(LoginRequiredMixin, LogoutView):
@@ -84,25 +114,13 @@ class ContractorLogoutView(LoginRequiredMixin, LogoutView):
     
     def get(self, request, *args, **kwargs):
         # Log activity before logout
-        ActivityLog.objects.create(
-            user=request.user,
-            action='logout'
-        )
+        log_activity(request.user, 'logout')
         # Redirect to home without showing logout template
         from django.contrib.auth import logout
         logout(request)
         return redirect(self.next_page)
     
-    def post(self, request, *args, **kwargs):
-        # Log activity before logout
-        ActivityLog.objects.create(
-            user=request.user,
-            action='logout'
-        )
-        # Redirect to home without showing logout template
-        from django.contrib.auth import logout
-        logout(request)
-        return redirect(self.next_page)
+    post = get
 
 
 class ContractorRegistrationView(CreateView):
@@ -123,14 +141,19 @@ class ContractorRegistrationView(CreateView):
 
 
 # Home and Dashboard Views
-def home_view(request):
-    """Home page view"""
-    context = {
+def _compute_home_stats():
+    return {
         'total_projects': Project.objects.filter(status='published').count(),
         'total_councils': User.objects.filter(user_type='council').count(),
         'total_contractors': User.objects.filter(user_type='contractor').count(),
         'total_bids': Bid.objects.filter(status='submitted').count(),
     }
+
+
+def home_view(request):
+    """Home page view"""
+    # Landing page totals only need to be roughly current, so reuse them for five minutes
+    context = cache.get_or_set('home_stats_v1', _compute_home_stats, 300)
     return render(request, 'home.html', context)
 
 
@@ -142,36 +165,42 @@ class ContractorDashboardView(ContractorRequiredMixin, View):
         user = request.user
         
         # Get statistics
-        total_bids = Bid.objects.filter(contractor=user).count()
-        active_bids = Bid.objects.filter(
-            contractor=user,
-            status__in=['draft', 'submitted', 'under_review']
-        ).count()
-        awarded_bids = Bid.objects.filter(
-            contractor=user,
-            status='accepted'
-        ).count()
+        bid_counts = Bid.objects.filter(contractor=user).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status__in=['draft', 'submitted', 'under_review'])),
+            awarded=Count('id', filter=Q(status='accepted')),
+        )
+        total_bids = bid_counts['total']
+        active_bids = bid_counts['active']
+        awarded_bids = bid_counts['awarded']
         
         success_rate = 0
         if total_bids > 0:
             success_rate = round((awarded_bids / total_bids) * 100, 2)
         
         # Get recent bids
-        recent_bids = Bid.objects.filter(contractor=user).order_by('-submitted_at')[:2]
+        recent_bids = Bid.objects.filter(contractor=user).select_related(
+            'package__project'
+        ).only(
+            'id', 'status', 'bid_amount', 'submitted_at',
+            'package__title', 'package__project__title',
+        ).order_by('-submitted_at')[:2]
         
         # Get available projects
         available_projects = Project.objects.filter(
             status='published'
-        ).annotate(
-            open_packages=Count('packages', filter=Q(packages__status='open'))
-        ).filter(open_packages__gt=0)[:5]
+        ).filter(
+            Exists(Package.objects.filter(project=OuterRef('pk'), status='open'))
+        ).only('id', 'title', 'description', 'end_date', 'created_at').prefetch_related(
+            Prefetch('packages', queryset=Package.objects.only('id', 'project_id', 'package_type', 'deadline'))
+        )[:5]
         
         # Get awarded projects (packages where this contractor's bid was accepted)
         awarded_packages = Package.objects.filter(
             awarded_bid__contractor=user
         ).exclude(
             status='open'
-        ).order_by('-created_at')[:10]
+        ).select_related('project', 'awarded_bid').order_by('-created_at')[:10]
         
         context = {
             'stats': {
@@ -196,21 +225,22 @@ class CouncilDashboardView(CouncilRequiredMixin, View):
     def get(self, request):
         user = request.user
         
-        # Get statistics
-        total_projects = Project.objects.filter(council=user).count()
-        published_projects = Project.objects.filter(council=user, status='published').count()
-        active_projects = Project.objects.filter(council=user, status='in_progress').count()
-        total_packages = Package.objects.filter(project__council=user).count()
-        open_packages = Package.objects.filter(project__council=user, status='open').count()
-        total_bids = Bid.objects.filter(package__project__council=user).count()
-        pending_bids_count = Bid.objects.filter(
-            package__project__council=user,
-            status__in=['submitted', 'under_review']
-        ).count()
-        accepted_bids = Bid.objects.filter(
-            package__project__council=user,
-            status='accepted'
-        ).count()
+        # Get statistics, one conditional aggregate per table
+        project_counts = Project.objects.filter(council=user).aggregate(
+            total=Count('id'),
+            published=Count('id', filter=Q(status='published')),
+            active=Count('id', filter=Q(status='in_progress')),
+        )
+        package_counts = Package.objects.filter(project__council=user).aggregate(
+            total=Count('id'),
+            open=Count('id', filter=Q(status='open')),
+        )
+        bid_counts = Bid.objects.filter(package__project__council=user).aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status__in=['submitted', 'under_review'])),
+            accepted=Count('id', filter=Q(status='accepted')),
+        )
+        pending_bids_count = bid_counts['pending']
         
         # Get recent projects
         recent_projects = Project.objects.filter(council=user).order_by('-created_at')[:2]
@@ -218,18 +248,21 @@ class CouncilDashboardView(CouncilRequiredMixin, View):
         # Get recent bids (all recent bids, not just pending)
         recent_bids = Bid.objects.filter(
             package__project__council=user
+        ).select_related('package', 'contractor').only(
+            'id', 'status', 'bid_amount', 'submitted_at',
+            'package__title', 'contractor__username',
         ).order_by('-submitted_at')[:2]
         
         context = {
             'stats': {
-                'total_projects': total_projects,
-                'published_projects': published_projects,
-                'active_projects': active_projects,
-                'total_packages': total_packages,
-                'open_packages': open_packages,
-                'total_bids': total_bids,
+                'total_projects': project_counts['total'],
+                'published_projects': project_counts['published'],
+                'active_projects': project_counts['active'],
+                'total_packages': package_counts['total'],
+                'open_packages': package_counts['open'],
+                'total_bids': bid_counts['total'],
                 'pending_bids': pending_bids_count,
-                'accepted_bids': accepted_bids,
+                'accepted_bids': bid_counts['accepted'],
             },
             'recent_projects': recent_projects,
             'recent_bids': recent_bids,
@@ -246,6 +279,14 @@ class ProjectListView(ListView):
     template_name = 'projects/project_list.html'
     context_object_name = 'projects'
     paginate_by = 12
+    paginator_class = CachedCountPaginator
+    
+    def get_paginator(self, queryset, *args, **kwargs):
+        # A council's own list must show the project they just created, so it counts afresh
+        user = self.request.user
+        if user.is_authenticated and user.user_type == 'council':
+            return Paginator(queryset, *args, **kwargs)
+        return super().get_paginator(queryset, *args, **kwargs)
     
     def get_queryset(self):
         user = self.request.user
@@ -275,16 +316,27 @@ class ProjectListView(ListView):
         sort = self.request.GET.get('sort_by', '-created_at')
         queryset = queryset.order_by(sort)
         
-        return queryset
+        # Project cards show the package types and count, and compare the council
+        return queryset.select_related('council').prefetch_related(
+            Prefetch('packages', queryset=Package.objects.only(
+                'id', 'project_id', 'title', 'package_type', 'status', 'estimated_cost', 'deadline'
+            ))
+        )
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        queryset = self.get_queryset()
-        context['total_projects'] = queryset.count()
-        context['published_count'] = queryset.filter(status='published').count()
-        context['in_progress_count'] = queryset.filter(status='in_progress').count()
-        context['completed_count'] = queryset.filter(status='completed').count()
+        # object_list is the filtered queryset ListView already built
+        counts = self.object_list.aggregate(
+            total=Count('id'),
+            published=Count('id', filter=Q(status='published')),
+            in_progress=Count('id', filter=Q(status='in_progress')),
+            completed=Count('id', filter=Q(status='completed')),
+        )
+        context['total_projects'] = counts['total']
+        context['published_count'] = counts['published']
+        context['in_progress_count'] = counts['in_progress']
+        context['completed_count'] = counts['completed']
         
         return context
 
@@ -296,8 +348,15 @@ class ProjectDetailView(DetailView):
     context_object_name = 'project'
     pk_url_kwarg = 'pk'
     
+    def get_queryset(self):
+        # Each package card shows its bid count, so annotate it on the prefetch
+        return Project.objects.select_related('council').prefetch_related(
+            Prefetch('packages', queryset=Package.objects.annotate(_bids_count=Count('bids')))
+        )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        # Served from the prefetch cache, so packages.count needs no query
         context['packages'] = self.object.packages.all()
         return context
 
@@ -313,14 +372,13 @@ class ProjectCreateView(CouncilRequiredMixin, CreateView):
         form.instance.council = self.request.user
         messages.success(self.request, "Project created successfully!")
         
-        # Log activity
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='project_created',
-            details=f"Created project: {form.instance.title}"
-        )
-        
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'project_created',
+                f"Created project: {form.instance.title}"
+            )
+            return super().form_valid(form)
 
 
 class ProjectUpdateView(OwnerOrCouncilMixin, UpdateView):
@@ -333,14 +391,13 @@ class ProjectUpdateView(OwnerOrCouncilMixin, UpdateView):
     def form_valid(self, form):
         messages.success(self.request, "Project updated successfully!")
         
-        # Log activity
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='project_updated',
-            details=f"Updated project: {form.instance.title}"
-        )
-        
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'project_updated',
+                f"Updated project: {form.instance.title}"
+            )
+            return super().form_valid(form)
 
 
 class ProjectDeleteView(OwnerOrCouncilMixin, DeleteView):
@@ -354,14 +411,14 @@ class ProjectDeleteView(OwnerOrCouncilMixin, DeleteView):
         return super().delete(request, *args, **kwargs)
 
 
-class PackageOwnerOrCouncilMixin(UserPassesTestMixin):
+class PackageOwnerOrCouncilMixin(CachedObjectMixin, UserPassesTestMixin):
     """Mixin to restrict to package owner (council) or superuser"""
     def test_func(self):
         package = self.get_object()
         return package.project.council == self.request.user or self.request.user.is_superuser
 
 
-class BidOwnerMixin(UserPassesTestMixin):
+class BidOwnerMixin(CachedObjectMixin, UserPassesTestMixin):
     """Mixin to restrict to bid owner or superuser"""
     def test_func(self):
         bid = self.get_object()
@@ -402,12 +459,18 @@ class PackageDetailView(DetailView):
     template_name = 'projects/package_detail.html'
     context_object_name = 'package'
     
+    def get_queryset(self):
+        return Package.objects.select_related('project__council').prefetch_related(
+            Prefetch('bids', queryset=Bid.objects.select_related('contractor').order_by('-submitted_at'))
+        )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['bids'] = self.object.bids.all()
-        context['user_bid'] = self.object.bids.filter(
-            contractor=self.request.user
-        ).first() if self.request.user.is_authenticated else None
+        # Both come from the prefetched bids, so no further queries
+        bids = list(self.object.bids.all())
+        context['bids'] = bids
+        user_id = self.request.user.pk if self.request.user.is_authenticated else None
+        context['user_bid'] = next((bid for bid in bids if bid.contractor_id == user_id), None)
         return context
 
 
@@ -435,24 +498,41 @@ class PackageCreateView(CouncilRequiredMixin, CreateView):
         
         messages.success(self.request, "Package created successfully!")
         
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='package_created',
-            details=f"Created package: {form.instance.title}"
-        )
-        
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'package_created',
+                f"Created package: {form.instance.title}"
+            )
+            return super().form_valid(form)
     
     def get_success_url(self):
         return reverse_lazy('project_detail', kwargs={'pk': self.object.project.id})
 
 
+def _compute_published_locations():
+    # order_by() keeps the default ordering column out of the DISTINCT
+    return list(
+        Project.objects.filter(status='published').order_by('location')
+        .values_list('location', flat=True).distinct()
+    )
+
+
+def _compute_open_package_counts():
+    now = timezone.now()
+    return Package.objects.filter(project__status='published', status='open').aggregate(
+        open=Count('id'),
+        deadline_soon=Count('id', filter=Q(deadline__gte=now, deadline__lte=now + timedelta(days=7))),
+    )
+
+
 class AvailableProjectsView(ContractorRequiredMixin, ListView):
     """View available projects for bidding"""
     model = Project
     template_name = 'projects/available_projects.html'
     context_object_name = 'projects'
     paginate_by = 12
+    paginator_class = CachedCountPaginator
     
     def get_queryset(self):
         queryset = Project.objects.filter(status='published')
@@ -462,10 +542,11 @@ class AvailableProjectsView(ContractorRequiredMixin, ListView):
         if location:
             queryset = queryset.filter(location=location)
         
-        # Package type filter
+        # Package filters, matched against a single package of the project
+        package_filters = {}
         package_type = self.request.GET.get('package_type')
         if package_type:
-            queryset = queryset.filter(packages__package_type=package_type)
+            package_filters['package_type'] = package_type
         
         # Search
         search = self.request.GET.get('search')
@@ -480,39 +561,37 @@ class AvailableProjectsView(ContractorRequiredMixin, ListView):
         max_budget = self.request.GET.get('max_budget')
         
         if min_budget:
-            queryset = queryset.filter(packages__estimated_cost__gte=min_budget)
+            package_filters['estimated_cost__gte'] = min_budget
         if max_budget:
-            queryset = queryset.filter(packages__estimated_cost__lte=max_budget)
+            package_filters['estimated_cost__lte'] = max_budget
+        
+        # EXISTS rather than a join, so no DISTINCT is needed and count() stays flat
+        if package_filters:
+            queryset = queryset.filter(Exists(
+                Package.objects.filter(project=OuterRef('pk'), **package_filters)
+            ))
         
         # Sort
         sort = self.request.GET.get('sort', '-created_at')
-        queryset = queryset.order_by(sort).distinct()
+        queryset = queryset.order_by(sort)
         
-        return queryset
+        # Project cards show the package count and the council's name
+        return queryset.select_related('council').annotate(package_count=Count('packages'))
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Get distinct locations
-        context['locations'] = Project.objects.filter(
-            status='published'
-        ).values_list('location', flat=True).distinct()
+        # Sidebar facets are the same for every contractor and change slowly
+        context['locations'] = cache.get_or_set('available_projects_locations', _compute_published_locations, 600)
         
-        # Count statistics
-        queryset = self.get_queryset()
-        context['total_projects'] = queryset.count()
-        context['open_packages_count'] = Package.objects.filter(
-            project__status='published',
-            status='open'
-        ).count()
+        # Count statistics; the paginator has already counted the filtered list
+        paginator = context.get('paginator')
+        context['total_projects'] = paginator.count if paginator else self.object_list.count()
+        package_counts = cache.get_or_set('available_projects_package_counts', _compute_open_package_counts, 300)
+        context['open_packages_count'] = package_counts['open']
         
         # Count packages with deadline soon (within 7 days)
-        context['deadline_soon_count'] = Package.objects.filter(
-            project__status='published',
-            status='open',
-            deadline__lte=timezone.now() + timedelta(days=7),
-            deadline__gte=timezone.now()
-        ).count()
+        context['deadline_soon_count'] = package_counts['deadline_soon']
         
         context['selected_location'] = self.request.GET.get('location', '')
         context['selected_package_type'] = self.request.GET.get('package_type', '')
@@ -539,30 +618,30 @@ class BidCreateView(ContractorRequiredMixin, CreateView):
         package_id = self.kwargs.get('package_id')
         package = get_object_or_404(Package, id=package_id)
         
-        # Check if contractor already bid on this package
-        existing_bid = Bid.objects.filter(
-            package=package,
-            contractor=self.request.user
-        ).first()
-        
-        if existing_bid:
-            messages.error(self.request, "You have already bid on this package.")
-            return redirect('package_detail', pk=package_id)
-        
         form.instance.package = package
         form.instance.contractor = self.request.user
         form.instance.status = 'submitted'
         form.instance.submitted_at = timezone.now()
         
-        messages.success(self.request, "Bid submitted successfully!")
-        
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='bid_submitted',
-            details=f"Submitted bid on package: {package.title}"
-        )
+        # Save and log in one transaction; the log row is written on commit.
+        # The (package, contractor) unique constraint rejects a second bid.
+        try:
+            with transaction.atomic():
+                response = super().form_valid(form)
+                log_activity(
+                    self.request.user,
+                    'bid_submitted',
+                    f"Submitted bid on package: {package.title}"
+                )
+        except IntegrityError:
+            # Only the duplicate-bid constraint is expected here; anything else is a real error
+            if not Bid.objects.filter(package_id=package_id, contractor=self.request.user).exists():
+                raise
+            messages.error(self.request, "You have already bid on this package.")
+            return redirect('package_detail', pk=package_id)
         
-        return super().form_valid(form)
+        messages.success(self.request, "Bid submitted successfully!")
+        return response
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -574,7 +653,7 @@ class BidCreateView(ContractorRequiredMixin, CreateView):
         return reverse_lazy('package_detail', kwargs={'pk': self.object.package.id})
 
 
-class BidDetailView(ContractorRequiredMixin, DetailView):
+class BidDetailView(ContractorRequiredMixin, CachedObjectMixin, DetailView):
     """View bid details"""
     model = Bid
     template_name = 'bids/bid_detail.html'
@@ -584,11 +663,11 @@ class BidDetailView(ContractorRequiredMixin, DetailView):
         bid = super().get_object()
         # Check if user is the contractor who submitted this bid
         if bid.contractor != self.request.user:
-            raise HttpResponseForbidden()
+            raise PermissionDenied
         return bid
 
 
-class BidUpdateView(ContractorRequiredMixin, UpdateView):
+class BidUpdateView(ContractorRequiredMixin, CachedObjectMixin, UpdateView):
     """Edit a submitted bid"""
     model = Bid
     form_class = BidForm
@@ -598,23 +677,23 @@ class BidUpdateView(ContractorRequiredMixin, UpdateView):
         bid = super().get_object()
         # Check if user is the contractor who submitted this bid
         if bid.contractor != self.request.user:
-            raise HttpResponseForbidden()
+            raise PermissionDenied
         return bid
     
     def form_valid(self, form):
         messages.success(self.request, "Bid updated successfully!")
         
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='bid_updated',
-            details=f"Updated bid on package: {form.instance.package.title}"
-        )
-        
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'bid_updated',
+                f"Updated bid on package: {form.instance.package.title}"
+            )
+            return super().form_valid(form)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['bid'] = self.get_object()
+        context['bid'] = self.object
         return context
     
     def get_success_url(self):
@@ -634,12 +713,13 @@ class BidWithdrawView(BidOwnerMixin, DetailView):
             messages.error(request, f"This bid cannot be withdrawn as it is already {bid.get_status_display()}.")
             return redirect('my_bids')
 
-        bid.withdraw()
-        ActivityLog.objects.create(
-            user=request.user,
-            action='bid_withdrawn',
-            details=f"Withdrew bid on package: {bid.package.title}"
-        )
+        with transaction.atomic():
+            bid.withdraw()
+            log_activity(
+                request.user,
+                'bid_withdrawn',
+                f"Withdrew bid on package: {bid.package.title}"
+            )
         messages.success(request, "Your bid has been successfully withdrawn.")
         return redirect('my_bids')
 
@@ -674,7 +754,12 @@ class MyBidsView(ContractorRequiredMixin, ListView):
     paginate_by = 20
     
     def get_queryset(self):
-        queryset = Bid.objects.filter(contractor=self.request.user).order_by('-submitted_at')
+        queryset = Bid.objects.filter(contractor=self.request.user).select_related(
+            'package__project'
+        ).only(
+            'id', 'status', 'bid_amount', 'duration_days', 'submitted_at', 'reviewed_at', 'review_notes',
+            'package__title', 'package__package_type', 'package__project__title',
+        ).order_by('-submitted_at')
         
         # Status filter
         status = self.request.GET.get('status')
@@ -703,6 +788,9 @@ class BidReviewListView(CouncilRequiredMixin, ListView):
         # Get bids for packages owned by this council
         queryset = Bid.objects.filter(
             package__project__council=self.request.user
+        ).select_related('package__project', 'contractor').only(
+            'id', 'status', 'bid_amount', 'duration_days', 'proposal_document', 'submitted_at', 'reviewed_at',
+            'package__title', 'package__estimated_cost', 'package__project__title', 'contractor__username',
         ).order_by('-submitted_at')
         
         # Status filter
@@ -713,7 +801,7 @@ class BidReviewListView(CouncilRequiredMixin, ListView):
         return queryset
 
 
-class BidReviewDetailView(CouncilRequiredMixin, DetailView):
+class BidReviewDetailView(CouncilRequiredMixin, CachedObjectMixin, DetailView):
     """Review a specific bid (Council only)"""
     model = Bid
     template_name = 'bids/bid_review_detail.html'
@@ -723,30 +811,34 @@ class BidReviewDetailView(CouncilRequiredMixin, DetailView):
         bid = super().get_object()
         # Check if user is authorized to review this bid
         if bid.package.project.council != self.request.user:
-            raise HttpResponseForbidden()
+            raise PermissionDenied
         return bid
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        bid = self.get_object()
+        bid = self.object
         
-        # Get other bids for comparison
-        other_bids = Bid.objects.filter(package=bid.package).exclude(id=bid.id)
-        context['other_bids'] = other_bids
+        # Fetch the package's bids once for both the comparison and the statistics
+        package_bids = list(Bid.objects.filter(package_id=bid.package_id).only('id', 'bid_amount', 'status'))
+        context['other_bids'] = [other for other in package_bids if other.pk != bid.pk]
         
         # Calculate bid statistics
-        all_bids = Bid.objects.filter(package=bid.package)
-        if all_bids.exists():
-            context['lowest_bid'] = all_bids.aggregate(min=Min('bid_amount'))['min']
-            context['highest_bid'] = all_bids.aggregate(max=Max('bid_amount'))['max']
-            context['average_bid'] = all_bids.aggregate(avg=Avg('bid_amount'))['avg']
+        amounts = [package_bid.bid_amount for package_bid in package_bids]
+        if amounts:
+            context['lowest_bid'] = min(amounts)
+            context['highest_bid'] = max(amounts)
+            context['average_bid'] = (sum(amounts) / len(amounts)).quantize(Decimal('0.01'))
         
         # Get contractor statistics
-        contractor_bids = Bid.objects.filter(contractor=bid.contractor)
+        contractor_counts = Bid.objects.filter(contractor_id=bid.contractor_id).aggregate(
+            total=Count('id'),
+            accepted=Count('id', filter=Q(status='accepted')),
+            pending=Count('id', filter=Q(status__in=['pending', 'under_review'])),
+        )
         context['contractor_stats'] = {
-            'total_bids': contractor_bids.count(),
-            'accepted_bids': contractor_bids.filter(status='accepted').count(),
-            'pending_bids': contractor_bids.filter(status__in=['pending', 'under_review']).count(),
+            'total_bids': contractor_counts['total'],
+            'accepted_bids': contractor_counts['accepted'],
+            'pending_bids': contractor_counts['pending'],
         }
         
         return context
@@ -756,115 +848,110 @@ class BidReviewDetailView(CouncilRequiredMixin, DetailView):
         action = request.POST.get('action')
         review_notes = request.POST.get('review_notes', '')
         
-        if action == 'accept':
-            bid.status = 'accepted'
-            bid.reviewed_by = request.user
-            bid.reviewed_at = timezone.now()
-            bid.review_notes = review_notes
-            bid.save()
-            
-            # Award the package to this contractor
-            bid.package.status = 'awarded'
-            bid.package.awarded_bid = bid
-            bid.package.save()
-            
-            messages.success(request, "Bid accepted and package awarded!")
-            
-            ActivityLog.objects.create(
-                user=request.user,
-                action='bid_accepted',
-                details=f"Accepted bid from {bid.contractor.get_display_name()} for {bid.package.title}"
-            )
-            
-        elif action == 'reject':
-            bid.status = 'rejected'
-            bid.reviewed_by = request.user
-            bid.reviewed_at = timezone.now()
-            bid.review_notes = review_notes
-            bid.save()
-            
-            messages.success(request, "Bid rejected!")
-            
-            ActivityLog.objects.create(
-                user=request.user,
-                action='bid_rejected',
-                details=f"Rejected bid from {bid.contractor.get_display_name()} for {bid.package.title}"
-            )
-        
-        elif action == 'save':
-            bid.review_notes = review_notes
-            bid.status = request.POST.get('status', bid.status)
-            bid.reviewed_by = request.user
-            bid.reviewed_at = timezone.now()
-            bid.save()
+        # Bid, package and log changes commit together
+        with transaction.atomic():
+            if action == 'accept':
+                bid.status = 'accepted'
+                bid.reviewed_by = request.user
+                bid.reviewed_at = timezone.now()
+                bid.review_notes = review_notes
+                bid.save()
+                
+                # Award the package to this contractor
+                bid.package.status = 'awarded'
+                bid.package.awarded_bid = bid
+                bid.package.save()
+                
+                messages.success(request, "Bid accepted and package awarded!")
+                
+                log_activity(
+                    request.user,
+                    'bid_accepted',
+                    f"Accepted bid from {bid.contractor.get_display_name()} for {bid.package.title}"
+                )
             
-            messages.success(request, "Bid evaluation saved!")
+            elif action == 'reject':
+                bid.status = 'rejected'
+                bid.reviewed_by = request.user
+                bid.reviewed_at = timezone.now()
+                bid.review_notes = review_notes
+                bid.save()
+                
+                messages.success(request, "Bid rejected!")
+                
+                log_activity(
+                    request.user,
+                    'bid_rejected',
+                    f"Rejected bid from {bid.contractor.get_display_name()} for {bid.package.title}"
+                )
             
-            ActivityLog.objects.create(
-                user=request.user,
-                action='bid_evaluated',
-                details=f"Evaluated bid from {bid.contractor.get_display_name()}"
-            )
+            elif action == 'save':
+                bid.review_notes = review_notes
+                bid.status = request.POST.get('status', bid.status)
+                bid.reviewed_by = request.user
+                bid.reviewed_at = timezone.now()
+                bid.save()
+                
+                messages.success(request, "Bid evaluation saved!")
+                
+                log_activity(
+                    request.user,
+                    'bid_evaluated',
+                    f"Evaluated bid from {bid.contractor.get_display_name()}"
+                )
         
         return redirect('bid_review_detail', pk=bid.id)
 
 
 class BidAcceptView(CouncilRequiredMixin, View):
     """Accept a bid (Council only)"""
+    http_method_names = ['post']
     
-    def get(self, request, pk):
-        bid = get_object_or_404(Bid, id=pk)
+    def post(self, request, pk):
+        bid = get_object_or_404(Bid.objects.select_related('package__project', 'contractor'), id=pk)
         
         # Check authorization
-        if bid.package.project.council != request.user:
-            raise HttpResponseForbidden()
-        
-        # Accept the bid
-        bid.status = 'accepted'
-        bid.reviewed_by = request.user
-        bid.reviewed_at = timezone.now()
-        bid.save()
+        if bid.package.project.council_id != request.user.pk:
+            raise PermissionDenied
         
-        # Award the package
-        bid.package.status = 'awarded'
-        bid.package.awarded_bid = bid
-        bid.package.save()
+        with transaction.atomic():
+            # Accept the bid and award the package, saving only the changed columns
+            bid.accept(request.user)
+            
+            log_activity(
+                request.user,
+                'bid_accepted',
+                f"Accepted bid from {bid.contractor.get_display_name()} for {bid.package.title}"
+            )
         
         messages.success(request, f"Bid from {bid.contractor.get_display_name()} accepted and package awarded!")
         
-        ActivityLog.objects.create(
-            user=request.user,
-            action='bid_accepted',
-            details=f"Accepted bid from {bid.contractor.get_display_name()} for {bid.package.title}"
-        )
-        
         return redirect('bid_review_detail', pk=bid.id)
 
 
 class BidRejectView(CouncilRequiredMixin, View):
     """Reject a bid (Council only)"""
+    http_method_names = ['post']
     
-    def get(self, request, pk):
-        bid = get_object_or_404(Bid, id=pk)
+    def post(self, request, pk):
+        bid = get_object_or_404(Bid.objects.select_related('package__project', 'contractor'), id=pk)
         
         # Check authorization
-        if bid.package.project.council != request.user:
-            raise HttpResponseForbidden()
+        if bid.package.project.council_id != request.user.pk:
+            raise PermissionDenied
         
-        # Reject the bid
-        bid.status = 'rejected'
-        bid.reviewed_by = request.user
-        bid.reviewed_at = timezone.now()
-        bid.save()
+        with transaction.atomic():
+            # Reject the bid, keeping any existing review notes
+            bid.reject(request.user, bid.review_notes)
+            
+            log_activity(
+                request.user,
+                'bid_rejected',
+                f"Rejected bid from {bid.contractor.get_display_name()} for {bid.package.title}"
+            )
         
         messages.success(request, f"Bid from {bid.contractor.get_display_name()} rejected!")
         
-        ActivityLog.objects.create(
-            user=request.user,
-            action='bid_rejected',
-            details=f"Rejected bid from {bid.contractor.get_display_name()} for {bid.package.title}"
-        )
-        
         return redirect('bid_review_detail', pk=bid.id)
 
 
@@ -903,15 +990,21 @@ class TeamListView(CouncilRequiredMixin, ListView):
         # Council's teams stats
         council_teams = ContractorTeam.objects.filter(project__council=self.request.user)
         
-        context['total_teams'] = council_teams.count()
-        context['active_teams'] = council_teams.filter(status='active').count()
-        context['forming_teams'] = council_teams.filter(status='forming').count()
-        context['completed_teams'] = council_teams.filter(status='completed').count()
+        # Team counts are distinct because the members join repeats each team
+        counts = council_teams.aggregate(
+            total=Count('id', distinct=True),
+            active=Count('id', filter=Q(status='active'), distinct=True),
+            forming=Count('id', filter=Q(status='forming'), distinct=True),
+            completed=Count('id', filter=Q(status='completed'), distinct=True),
+            members=Count('members'),
+        )
+        context['total_teams'] = counts['total']
+        context['active_teams'] = counts['active']
+        context['forming_teams'] = counts['forming']
+        context['completed_teams'] = counts['completed']
         
         # Statistics
-        context['total_members'] = sum(
-            team.members.count() for team in council_teams
-        )
+        context['total_members'] = counts['members']
         
         context['selected_status'] = self.request.GET.get('status', '')
         context['search_query'] = self.request.GET.get('search', '')
@@ -925,13 +1018,19 @@ class TeamDetailView(LoginRequiredMixin, DetailView):
     template_name = 'teams/team_detail.html'
     context_object_name = 'team'
     
+    def get_queryset(self):
+        return ContractorTeam.objects.select_related('project__council', 'lead_contractor').prefetch_related(
+            Prefetch('members', queryset=TeamMember.objects.select_related('contractor'))
+        )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         team = self.object
         
-        # Get team members with roles
-        context['members'] = team.members.all()
-        context['member_count'] = team.members.count()
+        # Get team members with roles, from the prefetch cache
+        members = list(team.members.all())
+        context['members'] = members
+        context['member_count'] = len(members)
         
         # Get all awarded contractors in the project
         context['awarded_contractors'] = team.awarded_contractors
@@ -945,7 +1044,7 @@ class TeamDetailView(LoginRequiredMixin, DetailView):
         
         # Check if user is lead or member
         context['is_lead'] = team.lead_contractor == self.request.user
-        context['is_member'] = team.members.filter(contractor=self.request.user).exists()
+        context['is_member'] = any(member.contractor_id == self.request.user.pk for member in members)
         
         # Project details
         context['project'] = team.project
@@ -974,15 +1073,16 @@ class TeamCreateView(CouncilRequiredMixin, CreateView):
         form.instance.assigned_by = self.request.user
         
         messages.success(self.request, "Team created successfully!")
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='team_created',
-            details=f"Created team: {form.instance.name}"
-        )
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'team_created',
+                f"Created team: {form.instance.name}"
+            )
+            return super().form_valid(form)
     
     def get_success_url(self):
-        return reverse_lazy('team_detail', kwargs={'pk': self.object.pk})
+        return reverse('team_detail', kwargs={'pk': self.object.pk})
 
 
 class TeamUpdateView(CouncilRequiredMixin, UpdateView):
@@ -1003,15 +1103,16 @@ class TeamUpdateView(CouncilRequiredMixin, UpdateView):
     
     def form_valid(self, form):
         messages.success(self.request, "Team updated successfully!")
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='team_updated',
-            details=f"Updated team: {form.instance.name}"
-        )
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'team_updated',
+                f"Updated team: {form.instance.name}"
+            )
+            return super().form_valid(form)
     
     def get_success_url(self):
-        return reverse_lazy('team_detail', kwargs={'pk': self.object.pk})
+        return reverse('team_detail', kwargs={'pk': self.object.pk})
 
 
 class TeamMemberAddView(CouncilRequiredMixin, CreateView):
@@ -1020,25 +1121,32 @@ class TeamMemberAddView(CouncilRequiredMixin, CreateView):
     form_class = TeamMemberForm
     template_name = 'teams/add_team_member.html'
     
+    @cached_property
+    def team(self):
+        # Fetched once per request, after the council check has passed
+        return get_object_or_404(
+            ContractorTeam.objects.select_related('project', 'lead_contractor'),
+            id=self.kwargs.get('team_id')
+        )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        team_id = self.kwargs.get('team_id')
-        context['team'] = ContractorTeam.objects.get(id=team_id)
+        context['team'] = self.team
         return context
     
     def form_valid(self, form):
-        team_id = self.kwargs.get('team_id')
-        form.instance.team_id = team_id
+        form.instance.team = self.team
         messages.success(self.request, "Team member added successfully!")
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='team_member_added',
-            details=f"Added {form.instance.contractor.get_display_name()} to team"
-        )
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'team_member_added',
+                f"Added {form.instance.contractor.get_display_name()} to team"
+            )
+            return super().form_valid(form)
     
     def get_success_url(self):
-        return reverse_lazy('team_detail', kwargs={'pk': self.kwargs.get('team_id')})
+        return reverse('team_detail', kwargs={'pk': self.kwargs.get('team_id')})
 
 
 class TeamMemberRemoveView(CouncilRequiredMixin, DeleteView):
@@ -1047,17 +1155,17 @@ class TeamMemberRemoveView(CouncilRequiredMixin, DeleteView):
     
     def delete(self, request, *args, **kwargs):
         member = self.get_object()
-        team_id = member.team.id
+        team_id = member.team_id
         messages.success(request, f"Removed {member.contractor.get_display_name()} from team")
-        ActivityLog.objects.create(
-            user=request.user,
-            action='team_member_removed',
-            details=f"Removed {member.contractor.get_display_name()} from team"
+        log_activity(
+            request.user,
+            'team_member_removed',
+            f"Removed {member.contractor.get_display_name()} from team"
         )
         return super().delete(request, *args, **kwargs)
     
     def get_success_url(self):
-        return reverse_lazy('team_detail', kwargs={'pk': self.object.team.id})
+        return reverse('team_detail', kwargs={'pk': self.object.team_id})
 
 
 # Profile Views
@@ -1074,12 +1182,15 @@ class ProfileView(LoginRequiredMixin, DetailView):
         context = super().get_context_data(**kwargs)
         
         if self.request.user.user_type == 'contractor':
-            context['total_bids'] = Bid.objects.filter(contractor=self.request.user).count()
-            context['awarded_bids'] = Bid.objects.filter(
-                contractor=self.request.user,
-                status='accepted'
-            ).count()
-            context['teams'] = ContractorTeam.objects.filter(lead_contractor=self.request.user)
+            stats = Bid.objects.filter(contractor=self.request.user).aggregate(
+                total=Count('id'),
+                awarded=Count('id', filter=Q(status='accepted')),
+            )
+            context['total_bids'] = stats['total']
+            context['awarded_bids'] = stats['awarded']
+            context['teams'] = ContractorTeam.objects.filter(
+                lead_contractor=self.request.user
+            ).select_related('project').only('id', 'name', 'status', 'project__title')
         
         return context
 
@@ -1096,12 +1207,13 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
     
     def form_valid(self, form):
         messages.success(self.request, "Profile updated successfully!")
-        ActivityLog.objects.create(
-            user=self.request.user,
-            action='profile_updated',
-            details="Updated profile information"
-        )
-        return super().form_valid(form)
+        with transaction.atomic():
+            log_activity(
+                self.request.user,
+                'profile_updated',
+                "Updated profile information"
+            )
+            return super().form_valid(form)
 
 
 # Analytics and Reporting Views
@@ -1115,14 +1227,25 @@ class BidAnalyticsView(CouncilRequiredMixin, View):
         # Get bids for this council's projects
         bids = Bid.objects.filter(package__project__council=user)
         
+        # All counts and totals in one conditional aggregate
+        stats = bids.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status__in=['draft', 'submitted'])),
+            under_review=Count('id', filter=Q(status='under_review')),
+            accepted=Count('id', filter=Q(status='accepted')),
+            rejected=Count('id', filter=Q(status='rejected')),
+            average=Avg('bid_amount'),
+            value=Sum('bid_amount'),
+        )
+        
         context = {
-            'total_bids': bids.count(),
-            'pending_bids': bids.filter(status__in=['draft', 'submitted']).count(),
-            'under_review_bids': bids.filter(status='under_review').count(),
-            'accepted_bids': bids.filter(status='accepted').count(),
-            'rejected_bids': bids.filter(status='rejected').count(),
-            'average_bid_amount': bids.aggregate(avg=Avg('bid_amount'))['avg'] or 0,
-            'total_bid_value': bids.aggregate(total=Sum('bid_amount'))['total'] or 0,
+            'total_bids': stats['total'],
+            'pending_bids': stats['pending'],
+            'under_review_bids': stats['under_review'],
+            'accepted_bids': stats['accepted'],
+            'rejected_bids': stats['rejected'],
+            'average_bid_amount': stats['average'] or 0,
+            'total_bid_value': stats['value'] or 0,
         }
         
         return render(request, self.template_name, context)
@@ -1140,6 +1263,9 @@ class ReportListView(CouncilRequiredMixin, ListView):
         return Report.objects.filter(
             Q(created_by=self.request.user) |
             Q(project__council=self.request.user)
+        ).select_related('project', 'created_by').only(
+            'id', 'title', 'report_type', 'content', 'created_at',
+            'project__title', 'created_by__username',
         ).order_by('-created_at')
 
 
@@ -1185,10 +1311,18 @@ class ReportDeleteView(CouncilRequiredMixin, DeleteView):
 class AutoGenerateReportView(CouncilRequiredMixin, View):
     """Auto-generate comprehensive reports"""
     template_name = 'reports/auto_generate.html'
+    # The report data is collected when the PDF is built, not here
+    REPORT_TITLES = {
+        'progress': 'Progress Report - {}',
+        'financial': 'Financial Analysis - {}',
+        'quality': 'Quality & Safety Report - {}',
+        'completion': 'Completion Report - {}',
+    }
     
     def get(self, request):
         """Display the auto-generate report form"""
-        projects = Project.objects.filter(council=request.user)
+        # The dropdown shows only title and location
+        projects = Project.objects.filter(council=request.user).only('id', 'title', 'location').order_by('title')
         report_types = [
             ('progress', 'Progress Report'),
             ('financial', 'Financial Report'),
@@ -1213,52 +1347,37 @@ class AutoGenerateReportView(CouncilRequiredMixin, View):
             return redirect('auto_generate_report')
         
         try:
-            project = get_object_or_404(Project, id=project_id, council=request.user)
-        except:
+            project = Project.objects.only('id', 'title').filter(id=project_id, council=request.user).first()
+        except ValidationError:
+            # Malformed project id
+            project = None
+        if project is None:
             messages.error(request, "Invalid project selected.")
             return redirect('auto_generate_report')
         
-        # Collect data based on report type
-        if report_type == 'progress':
-            report_data = collect_progress_data(project)
-            content_template = 'progress_report.html'
-        elif report_type == 'financial':
-            report_data = collect_financial_data(project)
-            content_template = 'financial_report.html'
-        elif report_type == 'quality':
-            report_data = collect_quality_data(project)
-            content_template = 'quality_report.html'
-        elif report_type == 'completion':
-            report_data = collect_completion_data(project)
-            content_template = 'completion_report.html'
-        else:
+        # Generate report title
+        title_format = self.REPORT_TITLES.get(report_type)
+        if title_format is None:
             messages.error(request, "Invalid report type selected.")
             return redirect('auto_generate_report')
-        
-        # Generate report title
-        report_titles = {
-            'progress': f'Progress Report - {project.title}',
-            'financial': f'Financial Analysis - {project.title}',
-            'quality': f'Quality & Safety Report - {project.title}',
-            'completion': f'Completion Report - {project.title}'
-        }
+        title = title_format.format(project.title)
         
         # Create report record
         report = Report.objects.create(
-            title=report_titles[report_type],
+            title=title,
             report_type=report_type,
             project=project,
             created_by=request.user,
             content=f"Auto-generated {report_type} report for {project.title}"
         )
         
-        messages.success(request, f"{report_titles[report_type]} generated successfully!")
+        messages.success(request, f"{title} generated successfully!")
         
         # Log activity
-        ActivityLog.objects.create(
-            user=request.user,
-            action='report_auto_generated',
-            details=f"Auto-generated {report_type} report for project: {project.title}"
+        log_activity(
+            request.user,
+            'report_auto_generated',
+            f"Auto-generated {report_type} report for project: {project.title}"
         )
         
         return redirect('report_list')
@@ -1269,20 +1388,15 @@ class ReportPDFDownloadView(CouncilRequiredMixin, View):
     
     def get(self, request, pk):
         """Download report as PDF"""
-        try:
-            # Allow council users to download reports they created or reports for their projects
-            report = get_object_or_404(
-                Report, 
-                id=pk
-            )
-            
-            # Check if council user has access to this report
-            if (report.created_by != request.user and 
-                (not report.project or report.project.council != request.user)):
-                messages.error(request, "Report not found or access denied.")
-                return redirect('report_list')
-                
-        except:
+        # Allow council users to download reports they created or reports for their projects
+        # Project, team lead and author are all read again while rendering the PDF
+        report = Report.objects.select_related(
+            'project__team__lead_contractor', 'created_by'
+        ).defer('project__team__notes').filter(id=pk).first()
+        
+        # Check if council user has access to this report
+        if report is None or (report.created_by_id != request.user.pk and
+                (not report.project or report.project.council_id != request.user.pk)):
             messages.error(request, "Report not found or access denied.")
             return redirect('report_list')
         
@@ -1291,10 +1405,10 @@ class ReportPDFDownloadView(CouncilRequiredMixin, View):
             pdf_response = generate_pdf_report(report)
             
             # Log activity
-            ActivityLog.objects.create(
-                user=request.user,
-                action='report_downloaded',
-                details=f"Downloaded PDF report: {report.title}"
+            log_activity(
+                request.user,
+                'report_downloaded',
+                f"Downloaded PDF report: {report.title}"
             )
             
             return pdf_response
@@ -1307,12 +1421,27 @@ class ReportPDFDownloadView(CouncilRequiredMixin, View):
 
        
 
+def _compute_awarded_stats(packages):
+    # Calculate stats and performance metrics in the database, without loading packages
+    return packages.aggregate(
+        total=Count('id'),
+        in_progress=Count('id', filter=Q(status='in_progress')),
+        completed=Count('id', filter=Q(status='completed')),
+        upcoming=Count('id', filter=Q(status='awarded')),
+        contract_value=Sum('awarded_bid__bid_amount'),
+        avg_duration=Avg('awarded_bid__duration_days'),
+    )
+
+
 class AwardedProjectsView(ContractorRequiredMixin, ListView):
     """View awarded projects"""
     model = Package
     template_name = 'bids/awarded_projects.html'
     context_object_name = 'packages'
     paginate_by = 12
+    ALLOWED_SORTS = frozenset({
+        'deadline', '-deadline', 'estimated_cost', '-estimated_cost', '-awarded_bid__reviewed_at',
+    })
     
     def get_queryset(self):
         queryset = Package.objects.filter(
@@ -1334,12 +1463,19 @@ class AwardedProjectsView(ContractorRequiredMixin, ListView):
         
         # Sort by requested field
         sort = self.request.GET.get('sort', '-awarded_bid__reviewed_at')
-        if sort in ['deadline', '-deadline', 'estimated_cost', '-estimated_cost', '-awarded_bid__reviewed_at']:
+        if sort in self.ALLOWED_SORTS:
             queryset = queryset.order_by(sort)
         else:
             queryset = queryset.order_by('-created_at')
         
-        return queryset
+        # Cards show the awarded bid, the project's council and the active team
+        return queryset.select_related('awarded_bid', 'project__council').prefetch_related(
+            Prefetch(
+                'teams',
+                queryset=ContractorTeam.objects.filter(status__in=['forming', 'active']),
+                to_attr='_active_teams',
+            )
+        )
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1350,11 +1486,16 @@ class AwardedProjectsView(ContractorRequiredMixin, ListView):
             status__in=['awarded', 'in_progress', 'completed']
         )
         
-        # Calculate stats
-        context['total_awards'] = all_packages.count()
-        context['in_progress_awards'] = all_packages.filter(status='in_progress').count()
-        context['completed_awards'] = all_packages.filter(status='completed').count()
-        context['upcoming_awards'] = all_packages.filter(status='awarded').count()
+        # Stats only move when a bid or package is saved; the signals drop the cached copy then
+        stats = cache.get_or_set(
+            awarded_stats_cache_key(self.request.user.pk),
+            partial(_compute_awarded_stats, all_packages),
+            300,
+        )
+        context['total_awards'] = stats['total']
+        context['in_progress_awards'] = stats['in_progress']
+        context['completed_awards'] = stats['completed']
+        context['upcoming_awards'] = stats['upcoming']
         
         # Filter params for template
         context['selected_status'] = self.request.GET.get('status', '')
@@ -1362,25 +1503,25 @@ class AwardedProjectsView(ContractorRequiredMixin, ListView):
         context['search_query'] = self.request.GET.get('search', '')
         
         # Performance metrics
-        context['total_contract_value'] = sum(
-            pkg.awarded_bid.bid_amount for pkg in all_packages if pkg.awarded_bid
-        )
-        context['average_project_duration'] = (
-            all_packages.aggregate(avg=Avg('awarded_bid__duration_days'))['avg'] or 0
-        )
+        context['total_contract_value'] = stats['contract_value'] or 0
+        context['average_project_duration'] = stats['avg_duration'] or 0
         
         # Completion rate
-        completed = all_packages.filter(status='completed').count()
-        total = all_packages.count()
+        completed = stats['completed']
+        total = stats['total']
         context['completion_rate'] = (completed / total * 100) if total > 0 else 0
         
         # Active projects
-        context['active_projects'] = all_packages.filter(status='in_progress').count()
+        context['active_projects'] = stats['in_progress']
         
-        # Upcoming packages with days remaining
-        upcoming = all_packages.filter(status='in_progress').order_by('deadline')
+        # Upcoming packages with days remaining; the sidebar shows the first three
+        now = timezone.now()
+        upcoming = list(
+            all_packages.filter(status='in_progress').select_related('project')
+            .only('id', 'title', 'deadline', 'project__title').order_by('deadline')[:3]
+        )
         for pkg in upcoming:
-            pkg.days_remaining = (pkg.deadline - timezone.now().date()).days if pkg.deadline else 0
+            pkg.days_remaining = (pkg.deadline - now).days if pkg.deadline else 0
         context['upcoming_packages'] = upcoming
         
         return context
@@ -1422,16 +1563,23 @@ class MyTeamsView(ContractorRequiredMixin, ListView):
             members__contractor=self.request.user
         ).distinct()
         
-        context['total_teams'] = all_teams.count()
-        context['active_teams'] = all_teams.filter(status='active').count()
-        context['forming_teams'] = all_teams.filter(status='forming').count()
-        context['completed_teams'] = all_teams.filter(status='completed').count()
+        counts = all_teams.aggregate(
+            total=Count('id', distinct=True),
+            active=Count('id', filter=Q(status='active'), distinct=True),
+            forming=Count('id', filter=Q(status='forming'), distinct=True),
+            completed=Count('id', filter=Q(status='completed'), distinct=True),
+            led=Count('id', filter=Q(lead_contractor=self.request.user), distinct=True),
+        )
+        context['total_teams'] = counts['total']
+        context['active_teams'] = counts['active']
+        context['forming_teams'] = counts['forming']
+        context['completed_teams'] = counts['completed']
         
         # Count teams as lead
-        context['led_teams_count'] = all_teams.filter(lead_contractor=self.request.user).count()
-        context['member_teams_count'] = all_teams.exclude(lead_contractor=self.request.user).count()
+        context['led_teams_count'] = counts['led']
+        context['member_teams_count'] = counts['total'] - counts['led']
         
-        # Get my awarded packages
+        # Get my awarded packages (lazy; only queried if the template uses it)
         context['my_awarded_packages'] = Package.objects.filter(
             awarded_bid__contractor=self.request.user,
             awarded_bid__status='accepted'
@@ -1467,59 +1615,79 @@ class PasswordChangeView(LoginRequiredMixin, View):
             return redirect('password_change')
         
         user.set_password(new_password1)
-        user.save()
+        user.save(update_fields=['password'])
         
         messages.success(request, "Password changed successfully!")
         return redirect('profile')
 
 
 # Export CSV views
+class Echo:
+    """Pseudo-buffer whose write() hands each CSV row back to the caller"""
+    
+    def write(self, value):
+        return value
+
+
+def csv_streaming_response(filename, header, rows):
+    """Stream rows as a CSV attachment without buffering the whole file"""
+    writer = csv.writer(Echo())
+    
+    def lines():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+    
+    response = StreamingHttpResponse(lines(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 class ExportBidsCSVView(CouncilRequiredMixin, View):
     """Export bids to CSV"""
     
     def get(self, request):
         # Get bids for this council's projects
-        bids = Bid.objects.filter(package__project__council=request.user)
-        
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="bids.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow(['Package', 'Contractor', 'Amount', 'Duration (Days)', 'Status', 'Submitted At'])
+        bids = Bid.objects.filter(package__project__council=request.user).select_related(
+            'package', 'contractor'
+        ).only(
+            'bid_amount', 'duration_days', 'status', 'submitted_at', 'package__title',
+            'contractor__username', 'contractor__first_name', 'contractor__last_name',
+            'contractor__company_name', 'contractor__user_type'
+        )
         
-        for bid in bids:
-            writer.writerow([
+        rows = (
+            [
                 bid.package.title,
                 bid.contractor.get_display_name(),
                 bid.bid_amount,
                 bid.duration_days,
-                bid.get_status_display(),
+                Bid._STATUS_DISPLAY.get(bid.status, bid.status),
                 bid.submitted_at
-            ])
-        
-        return response
+            ]
+            for bid in bids.iterator(chunk_size=1000)
+        )
+        return csv_streaming_response(
+            'bids.csv',
+            ['Package', 'Contractor', 'Amount', 'Duration (Days)', 'Status', 'Submitted At'],
+            rows
+        )
 
 
 class ExportProjectsCSVView(CouncilRequiredMixin, View):
     """Export projects to CSV"""
     
     def get(self, request):
-        projects = Project.objects.filter(council=request.user)
+        projects = Project.objects.filter(council=request.user).annotate(
+            package_count=Count('packages')
+        ).values_list('title', 'location', 'status', 'package_count', 'start_date', 'end_date')
         
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="projects.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow(['Title', 'Location', 'Status', 'Packages', 'Start Date', 'End Date'])
-        
-        for project in projects:
-            writer.writerow([
-                project.title,
-                project.location,
-                project.get_status_display(),
-                project.packages.count(),
-                project.start_date,
-                project.end_date
-            ])
-        
-        return response
+        rows = (
+            [title, location, Project._STATUS_DISPLAY.get(status, status), package_count, start_date, end_date]
+            for title, location, status, package_count, start_date, end_date in projects.iterator(chunk_size=1000)
+        )
+        return csv_streaming_response(
+            'projects.csv',
+            ['Title', 'Location', 'Status', 'Packages', 'Start Date', 'End Date'],
+            rows
+        )